@@ -74,9 +74,10 @@ class PantryManager:
             module = importlib.import_module(module_name)
             logger.debug(f"Successfully imported module: {module_name}")
 
-            # Find all functions in the module
-            for name, func in inspect.getmembers(module, inspect.isfunction):
-                if not name.startswith("_"):  # Register public functions
+            # Find all functions in the module; read the namespace directly rather than
+            # going through inspect.getmembers, which getattr()s and sorts every member
+            for name, func in module.__dict__.items():
+                if not name.startswith("_") and inspect.isfunction(func):  # Register public functions
                     # The ingredient name is `module_filename.function_name`
                     ingredient_key = f"{os.path.splitext(os.path.basename(module_path))[0]}.{name}"
                     self._registry[ingredient_key] = func
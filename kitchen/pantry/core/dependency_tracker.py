@@ -6,7 +6,7 @@ One task: dependency resolution and tracking.
 """
 
 import logging
-from typing import List, Set, Dict, Optional
+from typing import List, Set, Dict, Optional, Tuple
 from dataclasses import dataclass
 
 from .pantry_manager import PantryManager, IngredientMetadata
@@ -33,6 +33,10 @@ class DependencyTracker:
     def __init__(self, pantry_manager: PantryManager):
         """Initialize with pantry manager reference."""
         self.pantry_manager = pantry_manager
+        
+        # Resolved transitive dependencies, valid for one pantry revision
+        self._resolved: Dict[str, Tuple[str, ...]] = {}
+        self._resolved_revision = pantry_manager.revision
         logger.info("Dependency Tracker initialized")
     
     def get_dependencies(self, ingredient_id: str) -> List[str]:
@@ -79,6 +83,17 @@ class DependencyTracker:
         Returns:
             List of all dependency IDs in dependency order
         """
+        if self._resolved_revision != self.pantry_manager.revision:
+            self._resolved.clear()
+            self._resolved_revision = self.pantry_manager.revision
+        
+        cached = self._resolved.get(ingredient_id)
+        if cached is None:
+            cached = self._resolved[ingredient_id] = tuple(self._walk_dependencies(ingredient_id))
+        return list(cached)
+    
+    def _walk_dependencies(self, ingredient_id: str) -> List[str]:
+        """Walk the dependency graph depth-first, excluding the ingredient itself."""
         resolved = []
         visited = set()
         
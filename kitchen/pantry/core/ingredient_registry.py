@@ -6,7 +6,9 @@ One task: ingredient indexing and search.
 """
 
 import logging
-from typing import List, Optional
+import sys
+from collections import defaultdict
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -22,6 +24,47 @@ class SearchResult:
     relevance_score: float
 
 
+class PrefixTrie:
+    """
+    Character trie mapping string keys to ingredient IDs.
+    
+    Each node is a dict of child characters; the empty-string key holds the
+    IDs stored at that node.
+    """
+    
+    _VALUES = ""
+    
+    def __init__(self):
+        """Initialize an empty trie."""
+        self._root: Dict[str, dict] = {}
+    
+    def insert(self, key: str, ingredient_id: str) -> None:
+        """Store an ingredient ID under a key."""
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(self._VALUES, {})[ingredient_id] = None
+    
+    def find(self, prefix: str) -> List[str]:
+        """Return IDs stored under every key starting with prefix, sorted."""
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        
+        found: Dict[str, None] = {}
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if char == self._VALUES:
+                    found.update(child)
+                else:
+                    stack.append(child)
+        return sorted(found)
+
+
 class IngredientRegistry:
     """
     Simple ingredient registry for indexing and search.
@@ -32,8 +75,56 @@ class IngredientRegistry:
     def __init__(self, pantry_manager: PantryManager):
         """Initialize with pantry manager reference."""
         self.pantry_manager = pantry_manager
+        
+        # Indexes are built lazily and kept in step with the pantry revision
+        # Lowercased tag -> ingredient IDs (dict used as an insertion-ordered set)
+        self._tag_index: Optional[Dict[str, Dict[str, None]]] = None
+        self._id_trie = PrefixTrie()
+        self._tag_trie = PrefixTrie()
+        self._indexed_revision = -1
         logger.info("Ingredient Registry initialized")
     
+    def update_index(self, ingredient: IngredientMetadata) -> None:
+        """
+        Add a newly registered ingredient to the indexes.
+        
+        Args:
+            ingredient: Ingredient that was just registered
+        """
+        revision = self.pantry_manager.revision
+        if self._tag_index is None or self._indexed_revision != revision - 1:
+            # Indexes are missing or missed other writes; rebuild on next lookup
+            self._tag_index = None
+            return
+        
+        self._index_ingredient(ingredient)
+        self._indexed_revision = revision
+    
+    def _ensure_indexes(self) -> None:
+        """Rebuild the indexes if the pantry changed since they were built."""
+        revision = self.pantry_manager.revision
+        if self._tag_index is not None and self._indexed_revision == revision:
+            return
+        
+        self._tag_index = defaultdict(dict)
+        self._id_trie = PrefixTrie()
+        self._tag_trie = PrefixTrie()
+        for ingredient in self.pantry_manager.list_ingredients():
+            self._index_ingredient(ingredient)
+        self._indexed_revision = revision
+    
+    def _index_ingredient(self, ingredient: IngredientMetadata) -> None:
+        """Record an ingredient under its ID and each of its lowercased tags."""
+        self._id_trie.insert(ingredient.id, ingredient.id)
+        for tag in ingredient.tags:
+            tag = sys.intern(tag.lower())
+            self._tag_index[tag][ingredient.id] = None
+            self._tag_trie.insert(tag, ingredient.id)
+    
+    def _load_ingredients(self, ingredient_ids) -> List[IngredientMetadata]:
+        """Fetch ingredients by ID, skipping any that no longer exist."""
+        return self.pantry_manager.get_ingredients(ingredient_ids)
+    
     def search_ingredients(self, query: str, 
                           category: Optional[IngredientCategory] = None) -> List[SearchResult]:
         """
@@ -81,5 +172,15 @@ class IngredientRegistry:
     
     def get_ingredients_by_tag(self, tag: str) -> List[IngredientMetadata]:
         """Get all ingredients with a specific tag."""
-        all_ingredients = self.pantry_manager.list_ingredients()
-        return [ing for ing in all_ingredients if tag.lower() in [t.lower() for t in ing.tags]] 
\ No newline at end of file
+        self._ensure_indexes()
+        return self._load_ingredients(self._tag_index.get(tag.lower(), ()))
+    
+    def get_ingredients_by_id_prefix(self, prefix: str) -> List[IngredientMetadata]:
+        """Get all ingredients whose ID starts with a prefix."""
+        self._ensure_indexes()
+        return self._load_ingredients(self._id_trie.find(prefix))
+    
+    def get_ingredients_by_tag_prefix(self, prefix: str) -> List[IngredientMetadata]:
+        """Get all ingredients with a tag starting with a prefix."""
+        self._ensure_indexes()
+        return self._load_ingredients(self._tag_trie.find(prefix.lower())) 
\ No newline at end of file
@@ -7,7 +7,8 @@ One task: ingredient registration and retrieval.
 
 import json
 import logging
-from typing import Dict, List, Optional
+import sys
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass
@@ -19,6 +20,9 @@ from contextlib import contextmanager
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# IDs bound per "IN (...)" query; older SQLite builds allow at most 999 parameters
+_MAX_QUERY_PARAMS = 900
+
 
 class IngredientCategory(Enum):
     """Ingredient categories."""
@@ -51,6 +55,33 @@ class IngredientMetadata:
     created: datetime
     updated: datetime
     access_level: AccessLevel = AccessLevel.PUBLIC
+    
+    @classmethod
+    def new(cls, id: str, name: str, description: str, version: str,
+            category: IngredientCategory, dependencies: List[str], tags: List[str],
+            author: str, access_level: AccessLevel = AccessLevel.PUBLIC,
+            timestamp: Optional[datetime] = None) -> "IngredientMetadata":
+        """
+        Create a new ingredient with matching created/updated times.
+        
+        Args:
+            timestamp: Shared creation time, e.g. one value for a whole batch;
+                defaults to a single datetime.now() read
+            
+        Returns:
+            New ingredient metadata
+        """
+        now = timestamp or datetime.now()
+        return cls(
+            id=id, name=name, description=description, version=version,
+            category=category, dependencies=dependencies, tags=tags, author=author,
+            created=now, updated=now, access_level=access_level
+        )
+    
+    def __post_init__(self):
+        """Reject invalid categories once, at construction time."""
+        if not isinstance(self.category, IngredientCategory):
+            raise TypeError(f"Invalid category: {self.category!r}")
 
 
 class PantryManager:
@@ -68,6 +99,9 @@ class PantryManager:
         # Ensure directory exists
         self.pantry_root.mkdir(parents=True, exist_ok=True)
         
+        # Bumped on every successful write so dependents can invalidate caches
+        self.revision = 0
+        
         # Initialize database
         self._init_database()
         
@@ -91,6 +125,10 @@ class PantryManager:
                     access_level TEXT DEFAULT 'public'
                 )
             """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_ingredients_category
+                ON ingredients (category)
+            """)
             conn.commit()
     
     @contextmanager
@@ -128,6 +166,7 @@ class PantryManager:
                 ))
                 conn.commit()
             
+            self.revision += 1
             logger.info(f"Ingredient {ingredient.id} registered")
             return True
             
@@ -155,6 +194,34 @@ class PantryManager:
         
         return None
     
+    def get_ingredients(self, ingredient_ids: Iterable[str]) -> List[IngredientMetadata]:
+        """
+        Get several ingredients by ID over one connection.
+        
+        Args:
+            ingredient_ids: IDs of ingredients to retrieve
+            
+        Returns:
+            Ingredients in the order requested, skipping IDs that do not exist
+        """
+        ingredient_ids = list(ingredient_ids)
+        if not ingredient_ids:
+            return []
+        
+        found = {}
+        with self._get_db_connection() as conn:
+            # Batched to stay under SQLite's host parameter limit
+            for start in range(0, len(ingredient_ids), _MAX_QUERY_PARAMS):
+                batch = ingredient_ids[start:start + _MAX_QUERY_PARAMS]
+                placeholders = ", ".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT * FROM ingredients WHERE id IN ({placeholders})", batch
+                ).fetchall()
+                for row in rows:
+                    found[row['id']] = self._row_to_ingredient(row)
+        
+        return [found[ing_id] for ing_id in ingredient_ids if ing_id in found]
+    
     def list_ingredients(self, category: Optional[IngredientCategory] = None) -> List[IngredientMetadata]:
         """
         List ingredients with optional category filter.
@@ -184,10 +251,17 @@ class PantryManager:
             description=row['description'],
             version=row['version'],
             category=IngredientCategory(row['category']),
-            dependencies=json.loads(row['dependencies']) if row['dependencies'] else [],
-            tags=json.loads(row['tags']) if row['tags'] else [],
+            dependencies=self._load_string_list(row['dependencies']),
+            tags=self._load_string_list(row['tags']),
             author=row['author'],
             created=datetime.fromisoformat(row['created']),
             updated=datetime.fromisoformat(row['updated']),
             access_level=AccessLevel(row['access_level'])
-        ) 
\ No newline at end of file
+        ) 
+    
+    @staticmethod
+    def _load_string_list(value: Optional[str]) -> List[str]:
+        """Decode a JSON string list, interning entries shared across ingredients."""
+        if not value:
+            return []
+        return list(map(sys.intern, json.loads(value)))
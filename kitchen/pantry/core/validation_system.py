@@ -6,22 +6,36 @@ One task: ingredient validation and testing.
 """
 
 import logging
-from typing import List, Dict, Optional
+import os
+import string
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
-from .pantry_manager import PantryManager, IngredientMetadata, IngredientCategory
+from .pantry_manager import PantryManager, IngredientMetadata
 
 logger = logging.getLogger(__name__)
 
+# Translation table that deletes every allowed ID character; anything left over is invalid
+_ID_REJECT = str.maketrans('', '', string.ascii_lowercase + string.digits + '._-')
+
+
+def _push(messages: Optional[List[str]], message: str) -> List[str]:
+    """Append a message, allocating the list only on first use."""
+    if messages is None:
+        return [message]
+    messages.append(message)
+    return messages
+
 
 @dataclass
 class ValidationResult:
     """Validation result information."""
     ingredient_id: str
     valid: bool
-    errors: List[str]
-    warnings: List[str]
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...]
     timestamp: datetime
 
 
@@ -32,65 +46,84 @@ class ValidationSystem:
     Single responsibility: ingredient validation and testing.
     """
     
-    def __init__(self, pantry_manager: PantryManager):
-        """Initialize with pantry manager reference."""
+    def __init__(self, pantry_manager: PantryManager, parallel: bool = False,
+                 parallel_threshold: int = 256, max_workers: Optional[int] = None):
+        """
+        Initialize with pantry manager reference.
+        
+        Args:
+            pantry_manager: Pantry manager to validate against
+            parallel: Validate large batches on a thread pool
+            parallel_threshold: Minimum batch size before the pool is used
+            max_workers: Pool size (defaults to the CPU count)
+        """
         self.pantry_manager = pantry_manager
+        self.parallel = parallel
+        self.parallel_threshold = parallel_threshold
+        self.max_workers = max_workers or os.cpu_count() or 1
         logger.info("Validation System initialized")
     
-    def validate_ingredient(self, ingredient: IngredientMetadata) -> ValidationResult:
+    def validate_ingredient(self, ingredient: IngredientMetadata, *,
+                            now: Optional[datetime] = None,
+                            known_ids: Optional[Set[str]] = None) -> ValidationResult:
         """
         Validate an ingredient.
         
         Args:
             ingredient: Ingredient to validate
+            now: Optional timestamp to stamp on the result (shared across a batch)
+            known_ids: Optional set of registered IDs used to resolve dependencies
+                without querying the pantry
             
         Returns:
             Validation result
         """
-        errors = []
-        warnings = []
+        errors: Optional[List[str]] = None
+        warnings: Optional[List[str]] = None
         
         # Check required fields
         if not ingredient.id:
-            errors.append("Missing ingredient ID")
+            errors = _push(errors, "Missing ingredient ID")
         elif not self._is_valid_id(ingredient.id):
-            errors.append(f"Invalid ingredient ID format: {ingredient.id}")
+            errors = _push(errors, f"Invalid ingredient ID format: {ingredient.id}")
         
         if not ingredient.name:
-            errors.append("Missing ingredient name")
+            errors = _push(errors, "Missing ingredient name")
         
         if not ingredient.version:
-            errors.append("Missing ingredient version")
+            errors = _push(errors, "Missing ingredient version")
         elif not self._is_valid_version(ingredient.version):
-            errors.append(f"Invalid version format: {ingredient.version}")
+            errors = _push(errors, f"Invalid version format: {ingredient.version}")
         
         if not ingredient.description:
-            warnings.append("Missing ingredient description")
+            warnings = _push(warnings, "Missing ingredient description")
         
         if not ingredient.author:
-            warnings.append("Missing ingredient author")
+            warnings = _push(warnings, "Missing ingredient author")
         
-        # Check category
-        if not isinstance(ingredient.category, IngredientCategory):
-            errors.append(f"Invalid category: {ingredient.category}")
+        # Category type is enforced by IngredientMetadata.__post_init__
         
         # Check dependencies
         for dep in ingredient.dependencies:
-            if not self.pantry_manager.get_ingredient(dep):
-                warnings.append(f"Missing dependency: {dep}")
+            if known_ids is not None:
+                found = dep in known_ids
+            else:
+                found = self.pantry_manager.get_ingredient(dep) is not None
+            if not found:
+                warnings = _push(warnings, f"Missing dependency: {dep}")
         
         # Check tags
         if not ingredient.tags:
-            warnings.append("No tags specified")
+            warnings = _push(warnings, "No tags specified")
         
-        valid = len(errors) == 0
+        valid = not errors
         
         return ValidationResult(
             ingredient_id=ingredient.id,
             valid=valid,
-            errors=errors,
-            warnings=warnings,
-            timestamp=datetime.utcnow()
+            errors=tuple(errors) if errors else (),
+            warnings=tuple(warnings) if warnings else (),
+            timestamp=now or datetime.utcnow()
         )
     
     def validate_ingredient_by_id(self, ingredient_id: str) -> Optional[ValidationResult]:
@@ -116,11 +149,19 @@ class ValidationSystem:
             List of validation results
         """
         ingredients = self.pantry_manager.list_ingredients()
-        results = []
         
-        for ingredient in ingredients:
-            result = self.validate_ingredient(ingredient)
-            results.append(result)
+        # One timestamp and one ID snapshot for the whole batch
+        now = datetime.utcnow()
+        known_ids = {ingredient.id for ingredient in ingredients}
+        
+        def validate(ingredient: IngredientMetadata) -> ValidationResult:
+            return self.validate_ingredient(ingredient, now=now, known_ids=known_ids)
+        
+        if self.parallel and len(ingredients) >= self.parallel_threshold:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(validate, ingredients))
+        else:
+            results = [validate(ingredient) for ingredient in ingredients]
         
         return results
     
@@ -134,11 +175,18 @@ class ValidationSystem:
         results = self.validate_all_ingredients()
         
         total = len(results)
-        valid = sum(1 for r in results if r.valid)
-        invalid = total - valid
+        valid = 0
+        total_errors = 0
+        total_warnings = 0
+        
+        # Single pass over the results
+        for r in results:
+            if r.valid:
+                valid += 1
+            total_errors += len(r.errors)
+            total_warnings += len(r.warnings)
         
-        total_errors = sum(len(r.errors) for r in results)
-        total_warnings = sum(len(r.warnings) for r in results)
+        invalid = total - valid
         
         return {
             "total_ingredients": total,
@@ -160,10 +208,9 @@ class ValidationSystem:
             True if valid, False otherwise
         """
         # ID should be lowercase, use dots for hierarchy, no spaces
-        return (ingredient_id.islower() and 
-                '.' in ingredient_id and 
-                ' ' not in ingredient_id and
-                all(c.isalnum() or c in '._-' for c in ingredient_id))
+        return (ingredient_id.islower() and
+                '.' in ingredient_id and
+                not ingredient_id.translate(_ID_REJECT))
     
     def _is_valid_version(self, version: str) -> bool:
         """
@@ -23,10 +23,11 @@ def create_complex_ingredients():
     print("=" * 50)
     
     pantry = PantryManager()
+    now = datetime.now()
     
     # Create base tools
     base_tools = [
-        IngredientMetadata(
+        IngredientMetadata.new(
             id='tool.pandas',
             name='Pandas Data Tool',
             description='Data manipulation and analysis tool',
@@ -35,11 +36,10 @@ def create_complex_ingredients():
             dependencies=[],
             tags=['data', 'pandas', 'analysis'],
             author='data_team',
-            created=datetime.now(),
-            updated=datetime.now(),
+            timestamp=now,
             access_level=AccessLevel.PUBLIC
         ),
-        IngredientMetadata(
+        IngredientMetadata.new(
             id='tool.numpy',
             name='NumPy Array Tool',
             description='Numerical computing tool',
@@ -48,11 +48,10 @@ def create_complex_ingredients():
             dependencies=[],
             tags=['data', 'numpy', 'numerical'],
             author='data_team',
-            created=datetime.now(),
-            updated=datetime.now(),
+            timestamp=now,
             access_level=AccessLevel.PUBLIC
         ),
-        IngredientMetadata(
+        IngredientMetadata.new(
             id='tool.matplotlib',
             name='Matplotlib Visualization Tool',
             description='Data visualization tool',
@@ -61,15 +60,14 @@ def create_complex_ingredients():
             dependencies=['tool.numpy'],
             tags=['data', 'visualization', 'plotting'],
             author='data_team',
-            created=datetime.now(),
-            updated=datetime.now(),
+            timestamp=now,
             access_level=AccessLevel.PUBLIC
         )
     ]
     
     # Create modules that depend on tools
     modules = [
-        IngredientMetadata(
+        IngredientMetadata.new(
             id='module.statistics',
             name='Statistics Module',
             description='Statistical analysis module',
@@ -78,11 +76,10 @@ def create_complex_ingredients():
             dependencies=['tool.pandas', 'tool.numpy'],
             tags=['statistics', 'analysis', 'math'],
             author='data_team',
-            created=datetime.now(),
-            updated=datetime.now(),
+            timestamp=now,
             access_level=AccessLevel.PROTECTED
         ),
-        IngredientMetadata(
+        IngredientMetadata.new(
             id='module.visualization',
             name='Visualization Module',
             description='Data visualization module',
@@ -91,15 +88,14 @@ def create_complex_ingredients():
             dependencies=['tool.matplotlib', 'tool.pandas'],
             tags=['visualization', 'plotting', 'charts'],
             author='data_team',
-            created=datetime.now(),
-            updated=datetime.now(),
+            timestamp=now,
             access_level=AccessLevel.PROTECTED
         )
     ]
     
     # Create complex tasks
     tasks = [
-        IngredientMetadata(
+        IngredientMetadata.new(
             id='task.data_analysis',
             name='Complete Data Analysis',
             description='Full data analysis pipeline',
@@ -108,11 +104,10 @@ def create_complex_ingredients():
             dependencies=['module.statistics', 'module.visualization'],
             tags=['analysis', 'pipeline', 'complete'],
             author='data_team',
-            created=datetime.now(),
-            updated=datetime.now(),
+            timestamp=now,
             access_level=AccessLevel.PROTECTED
         ),
-        IngredientMetadata(
+        IngredientMetadata.new(
             id='task.machine_learning',
             name='Machine Learning Pipeline',
             description='ML model training and evaluation',
@@ -121,8 +116,7 @@ def create_complex_ingredients():
             dependencies=['module.statistics', 'tool.pandas'],
             tags=['ml', 'training', 'evaluation'],
             author='ml_team',
-            created=datetime.now(),
-            updated=datetime.now(),
+            timestamp=now,
             access_level=AccessLevel.ADMIN
         )
     ]
@@ -306,7 +300,7 @@ def demonstrate_real_world_scenario():
     
     # Step 2: Create new task
     print("\n2️⃣ CREATING NEW ANALYSIS TASK")
-    new_analysis = IngredientMetadata(
+    new_analysis = IngredientMetadata.new(
         id='task.custom_analysis',
         name='Custom Data Analysis',
         description='Custom analysis combining statistics and visualization',
@@ -315,8 +309,6 @@ def demonstrate_real_world_scenario():
         dependencies=['module.statistics', 'module.visualization'],
         tags=['custom', 'analysis', 'combined'],
         author='data_scientist',
-        created=datetime.now(),
-        updated=datetime.now(),
         access_level=AccessLevel.PROTECTED
     )
     
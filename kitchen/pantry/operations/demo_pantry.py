@@ -6,11 +6,12 @@ Shows practical examples of what the pantry system can do
 
 import sys
 from pathlib import Path
-from datetime import datetime
 
 # Add the pantry directory to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from script_output import buffered_output
+
 from core.pantry_manager import PantryManager, IngredientMetadata, IngredientCategory, AccessLevel
 from core.dependency_tracker import DependencyTracker
 from core.access_control import AccessControl, Permission
@@ -33,7 +34,7 @@ def demo_pantry_system():
     print("\n1️⃣ REGISTERING A NEW INGREDIENT")
     print("-" * 30)
     
-    new_task = IngredientMetadata(
+    new_task = IngredientMetadata.new(
         id='task.data_analyzer',
         name='Data Analysis Task',
         description='Performs statistical analysis on datasets',
@@ -42,8 +43,6 @@ def demo_pantry_system():
         dependencies=['tool.pandas', 'module.statistics'],
         tags=['data', 'analysis', 'statistics', 'pandas'],
         author='data_team',
-        created=datetime.now(),
-        updated=datetime.now(),
         access_level=AccessLevel.PROTECTED
     )
     
@@ -217,6 +216,7 @@ def show_use_cases():
         print(f"   📝 {use_case['description']}")
         print(f"   💡 Example: {use_case['example']}")
 
+@buffered_output
 def main():
     """Main demonstration"""
     print("🚀 Starting Pantry System Examples...")
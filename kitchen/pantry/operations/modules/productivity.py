@@ -10,6 +10,15 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Static pipeline shared by every response; a tuple so callers cannot mutate it
+_OPTIMIZED_STEPS = (
+    "Analyze current process",
+    "Identify bottlenecks",
+    "Design improvements",
+    "Implement changes",
+    "Monitor results"
+)
+
 class ProductivityModule:
     """Productivity module operations"""
     
@@ -23,13 +32,7 @@ class ProductivityModule:
                 'operation': 'optimize_workflow_pipeline',
                 'workflow_type': workflow_type,
                 'current_steps': current_steps,
-                'optimized_steps': [
-                    "Analyze current process",
-                    "Identify bottlenecks",
-                    "Design improvements",
-                    "Implement changes",
-                    "Monitor results"
-                ],
+                'optimized_steps': _OPTIMIZED_STEPS,
                 'efficiency_improvement': "30%",
                 'timestamp': datetime.now().isoformat()
             }
@@ -5,8 +5,11 @@ This module coordinates all pantry system components.
 One task: system orchestration.
 """
 
+import copy
 import logging
-from typing import List, Optional
+from collections import OrderedDict
+from functools import cached_property
+from typing import List, Optional, Tuple
 
 from .core.pantry_manager import PantryManager, IngredientMetadata, IngredientCategory
 from .core.ingredient_registry import IngredientRegistry
@@ -14,7 +17,7 @@ from .core.resource_storage import ResourceStorage
 from .core.dependency_tracker import DependencyTracker
 from .core.access_control import AccessControl
 from .core.discovery_engine import DiscoveryEngine
-from .core.validation_system import ValidationSystem
+from .core.validation_system import ValidationSystem, ValidationResult
 
 logger = logging.getLogger(__name__)
 
@@ -26,23 +29,57 @@ class PantrySystem:
     Coordinates all pantry components for complete functionality.
     """
     
-    def __init__(self, pantry_root: str = "recipes/pantry"):
+    def __init__(self, pantry_root: str = "recipes/pantry", validation_cache_size: int = 1024):
         """
-        Initialize pantry system with all components.
+        Initialize pantry system.
         
         Args:
             pantry_root: Root directory for pantry system
+            validation_cache_size: Maximum number of cached validation results
         """
-        # Initialize core components
+        # Everything depends on the pantry manager; other components are created on first use
+        self.pantry_root = pantry_root
         self.pantry_manager = PantryManager(pantry_root)
-        self.ingredient_registry = IngredientRegistry(self.pantry_manager)
-        self.resource_storage = ResourceStorage(f"{pantry_root}/storage")
-        self.dependency_tracker = DependencyTracker(self.pantry_manager)
-        self.access_control = AccessControl(self.pantry_manager)
-        self.discovery_engine = DiscoveryEngine(self.pantry_manager)
-        self.validation_system = ValidationSystem(self.pantry_manager)
         
-        logger.info("Pantry System initialized with all components")
+        # Validation results keyed by (id, version), stored with a copy of the metadata
+        # they checked, in least-recently-used order and capped at validation_cache_size.
+        # Registering an ingredient only drops the results that list it as a dependency;
+        # any pantry write made outside this system clears the whole cache.
+        self._validated: "OrderedDict[Tuple[str, str], Tuple[IngredientMetadata, ValidationResult]]" = OrderedDict()
+        self._validated_revision = self.pantry_manager.revision
+        self.validation_cache_size = validation_cache_size
+        
+        logger.info("Pantry System initialized")
+    
+    @cached_property
+    def ingredient_registry(self) -> IngredientRegistry:
+        """Ingredient index and search."""
+        return IngredientRegistry(self.pantry_manager)
+    
+    @cached_property
+    def resource_storage(self) -> ResourceStorage:
+        """Resource file storage."""
+        return ResourceStorage(f"{self.pantry_root}/storage")
+    
+    @cached_property
+    def dependency_tracker(self) -> DependencyTracker:
+        """Dependency resolution."""
+        return DependencyTracker(self.pantry_manager)
+    
+    @cached_property
+    def access_control(self) -> AccessControl:
+        """Access permission checks."""
+        return AccessControl(self.pantry_manager)
+    
+    @cached_property
+    def discovery_engine(self) -> DiscoveryEngine:
+        """Filesystem ingredient discovery."""
+        return DiscoveryEngine(self.pantry_manager)
+    
+    @cached_property
+    def validation_system(self) -> ValidationSystem:
+        """Ingredient validation."""
+        return ValidationSystem(self.pantry_manager)
     
     def register_ingredient(self, ingredient: IngredientMetadata) -> bool:
         """
@@ -55,7 +92,7 @@ class PantrySystem:
             True if successful, False otherwise
         """
         # Validate ingredient first
-        validation = self.validation_system.validate_ingredient(ingredient)
+        validation = self._validate_cached(ingredient)
         if not validation.valid:
             logger.error(f"Ingredient validation failed: {validation.errors}")
             return False
@@ -63,6 +100,7 @@ class PantrySystem:
         # Register with pantry manager
         success = self.pantry_manager.register_ingredient(ingredient)
         if success:
+            self._invalidate_dependents(ingredient.id)
             # Update registry index
             self.ingredient_registry.update_index(ingredient)
             logger.info(f"Ingredient {ingredient.id} registered successfully")
@@ -82,6 +120,30 @@ class PantrySystem:
         """
         return self.ingredient_registry.search_ingredients(query, category)
     
+    def search_by_tag(self, tag: str) -> List[IngredientMetadata]:
+        """
+        Find ingredients carrying a tag.
+        
+        Args:
+            tag: Tag to look up (case-insensitive)
+            
+        Returns:
+            List of matching ingredients
+        """
+        return self.ingredient_registry.get_ingredients_by_tag(tag)
+    
+    def find_by_id_prefix(self, prefix: str) -> List[IngredientMetadata]:
+        """
+        Find ingredients whose ID starts with a prefix (e.g. "task.").
+        
+        Args:
+            prefix: ID prefix
+            
+        Returns:
+            List of matching ingredients
+        """
+        return self.ingredient_registry.get_ingredients_by_id_prefix(prefix)
+    
     def get_ingredient(self, ingredient_id: str) -> Optional[IngredientMetadata]:
         """
         Get ingredient by ID.
@@ -125,7 +187,70 @@ class PantrySystem:
         Returns:
             Validation result if ingredient exists, None otherwise
         """
-        return self.validation_system.validate_ingredient_by_id(ingredient_id)
+        # Same lookup as ValidationSystem.validate_ingredient_by_id, but the metadata is
+        # needed here to reuse the result cached when the ingredient was registered
+        ingredient = self.pantry_manager.get_ingredient(ingredient_id)
+        if ingredient:
+            return self._validate_cached(ingredient)
+        return None
+    
+    def _validate_cached(self, ingredient: IngredientMetadata) -> ValidationResult:
+        """
+        Validate an ingredient, reusing the result for identical metadata.
+        
+        Args:
+            ingredient: Ingredient to validate
+            
+        Returns:
+            Validation result
+        """
+        key = (ingredient.id, ingredient.version)
+        cached = self._cached_validation(key)
+        if cached and cached[0] == ingredient:
+            return cached[1]
+        
+        validation = self.validation_system.validate_ingredient(ingredient)
+        self._store_validation(key, copy.deepcopy(ingredient), validation)
+        return validation
+    
+    def _cached_validation(self, key: Tuple[str, str]) -> Optional[Tuple[IngredientMetadata, ValidationResult]]:
+        """Look up a cached validation, discarding the cache if the pantry was written outside this system."""
+        if self._validated_revision != self.pantry_manager.revision:
+            self._validated.clear()
+            self._validated_revision = self.pantry_manager.revision
+            return None
+        
+        cached = self._validated.get(key)
+        if cached:
+            self._validated.move_to_end(key)
+        return cached
+    
+    def _store_validation(self, key: Tuple[str, str], ingredient: IngredientMetadata,
+                          validation: ValidationResult) -> None:
+        """Cache a validation result, evicting the least recently used entry when full."""
+        self._validated[key] = (ingredient, validation)
+        if len(self._validated) > self.validation_cache_size:
+            self._validated.popitem(last=False)
+    
+    def _invalidate_dependents(self, ingredient_id: str) -> None:
+        """
+        Drop cached validations that a newly registered ingredient may change.
+        
+        Only results listing the ingredient as a dependency are affected. If other
+        writes happened since the cache was last in step, everything is dropped.
+        
+        Args:
+            ingredient_id: ID of the ingredient that was just registered
+        """
+        revision = self.pantry_manager.revision
+        if self._validated_revision != revision - 1:
+            self._validated.clear()
+        else:
+            stale = [key for key, (cached, _) in self._validated.items()
+                     if ingredient_id in cached.dependencies]
+            for key in stale:
+                del self._validated[key]
+        self._validated_revision = revision
     
     def get_dependencies(self, ingredient_id: str) -> List[str]:
         """
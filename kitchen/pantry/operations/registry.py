@@ -5,10 +5,12 @@ Dynamic registry system for discovering and loading operations automatically.
 This allows for scalable operation management without hardcoding imports.
 """
 
+import ast
 import os
+import sys
 import json
 import importlib
-import inspect
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Type, Union
 from datetime import datetime
@@ -16,9 +18,15 @@ from datetime import datetime
 class OperationRegistry:
     """Dynamic registry for discovering and managing operations"""
     
-    def __init__(self, operations_root: Optional[str] = None):
+    def __init__(self, operations_root: Optional[str] = None, cache_size: int = 256):
         self.operations_root = Path(operations_root) if operations_root else Path(__file__).parent
-        self.operations_cache = {}
+        self.cache_path = self.operations_root / ".registry_cache.json"
+        # Path prefix stripped from discovered files to form module names
+        root_parent = self.operations_root.parent
+        self._module_path_prefix = "" if root_parent == Path(".") else os.path.join(str(root_parent), "")
+        # Instances in least-recently-used order, capped at cache_size
+        self.operations_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self.cache_size = cache_size
         self.operation_metadata = {}
         self.discovery_cache = {}
         
@@ -34,57 +42,112 @@ class OperationRegistry:
             'skills': {}
         }
         
-        # Scan operations directory structure
+        disk_cache = {} if force_refresh else self._load_disk_cache()
+        new_disk_cache = {}
+        
+        # Scan operations directory structure, reusing categories whose files are unchanged
         for category in operations.keys():
             category_path = self.operations_root / category
-            if category_path.exists():
+            if not category_path.exists():
+                continue
+            
+            signature = self._category_signature(category_path)
+            cached = disk_cache.get(category)
+            if cached and cached.get('signature') == signature:
+                operations[category] = cached['operations']
+            else:
                 operations[category] = self._scan_category(category_path, category)
+            
+            new_disk_cache[category] = {
+                'signature': signature,
+                'operations': {
+                    op_id: {k: v for k, v in op_info.items() if k != 'class_obj'}
+                    for op_id, op_info in operations[category].items()
+                }
+            }
+        
+        if new_disk_cache != disk_cache:
+            self._save_disk_cache(new_disk_cache)
                 
         self.discovery_cache = operations
         return operations
     
+    def _category_signature(self, category_path: Path) -> List[int]:
+        """Latest mtime and entry count of a category tree, used to validate the disk cache"""
+        latest = category_path.stat().st_mtime_ns
+        count = 0
+        for entry in self._walk(category_path):
+            if entry.is_dir(follow_symlinks=False) or entry.name.endswith(".py"):
+                latest = max(latest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                count += 1
+        return [latest, count]
+    
+    def _walk(self, path: Union[str, Path]):
+        """Recursively yield directory entries under path using os.scandir"""
+        with os.scandir(path) as it:
+            for entry in it:
+                yield entry
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._walk(entry.path)
+    
+    def _load_disk_cache(self) -> Dict[str, Any]:
+        """Load the persisted discovery map, if any"""
+        try:
+            with open(self.cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_disk_cache(self, data: Dict[str, Any]) -> None:
+        """Persist the discovery map without class objects"""
+        try:
+            with open(self.cache_path, 'w') as f:
+                json.dump(data, f)
+        except OSError as e:
+            print(f"Warning: Could not write registry cache {self.cache_path}: {e}")
+    
     def _scan_category(self, category_path: Path, category: str) -> Dict[str, Any]:
         """Scan a category directory for operations"""
         category_ops = {}
         
         # Look for Python files in the category
-        for py_file in category_path.rglob("*.py"):
-            if py_file.name.startswith("__"):
+        for entry in self._walk(category_path):
+            if (not entry.name.endswith(".py") or entry.name.startswith("__")
+                    or entry.is_dir(follow_symlinks=False)):
                 continue
+            py_file = entry.path
                 
             module_name = self._path_to_module_name(py_file)
             try:
-                # Import the module
-                module = importlib.import_module(module_name)
+                # Parse instead of importing; the module is imported on first get_operation
+                with open(py_file, 'rb') as f:
+                    tree = ast.parse(f.read(), filename=py_file)
                 
                 # Find operation classes in the module
-                for name, obj in inspect.getmembers(module):
-                    if (inspect.isclass(obj) and 
-                        name.endswith('Operations') and 
-                        hasattr(obj, '__init__')):
-                        
+                for node in tree.body:
+                    if isinstance(node, ast.ClassDef) and node.name.endswith('Operations'):
+                        name = node.name
                         operation_id = f"{category}.{name.lower()}"
                         category_ops[operation_id] = {
                             'module': module_name,
                             'class': name,
-                            'class_obj': obj,
-                            'file_path': str(py_file),
+                            'file_path': py_file,
                             'discovered_at': datetime.now().isoformat()
                         }
                         
-            except Exception as e:
+            except (OSError, SyntaxError, ValueError) as e:
                 print(f"Warning: Could not load operations from {py_file}: {e}")
                 
         return category_ops
     
-    def _path_to_module_name(self, file_path: Path) -> str:
-        """Convert file path to module name"""
-        relative_path = file_path.relative_to(self.operations_root.parent)
-        return str(relative_path).replace(os.sep, '.').replace('.py', '')
+    def _path_to_module_name(self, file_path: str) -> str:
+        """Convert a file path under the operations root to a module name"""
+        return file_path[len(self._module_path_prefix):-3].replace(os.sep, '.')
     
     def get_operation(self, operation_id: str) -> Optional[Any]:
         """Get an operation instance by ID"""
         if operation_id in self.operations_cache:
+            self.operations_cache.move_to_end(operation_id)
             return self.operations_cache[operation_id]
             
         # Parse operation ID (e.g., "tools.image_editor_operations")
@@ -107,12 +170,16 @@ class OperationRegistry:
             
         # Load the operation
         op_info = self.discovery_cache[category][operation_id]
-        module = importlib.import_module(op_info['module'])
-        operation_class = getattr(module, op_info['class'])
+        operation_class = op_info.get('class_obj')
+        if operation_class is None:
+            module = sys.modules.get(op_info['module']) or importlib.import_module(op_info['module'])
+            operation_class = op_info['class_obj'] = getattr(module, op_info['class'])
         
         # Create instance and cache it
         instance = operation_class({})  # Default config
         self.operations_cache[operation_id] = instance
+        if len(self.operations_cache) > self.cache_size:
+            self.operations_cache.popitem(last=False)
         
         return instance
     
@@ -0,0 +1,21 @@
+"""
+Script Output Helpers
+Shared output handling for the pantry command-line scripts
+"""
+
+import io
+import sys
+from contextlib import redirect_stdout
+from functools import wraps
+
+def buffered_output(func):
+    """Collect everything func prints and write it to stdout in one call"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+    return wrapper
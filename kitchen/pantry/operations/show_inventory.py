@@ -5,13 +5,20 @@ Displays all ingredients in the pantry system
 """
 
 import sys
+from collections import Counter, defaultdict
 from pathlib import Path
 
 # Add the pantry directory to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from core.pantry_manager import PantryManager, IngredientCategory
+from script_output import buffered_output
 
+from core.pantry_manager import PantryManager, IngredientCategory, AccessLevel
+
+# Category display order and section titles, computed once at import
+_CATEGORY_TITLES = tuple((category, f"📦 {category.value.upper()}") for category in IngredientCategory)
+
+@buffered_output
 def show_inventory():
     """Show complete pantry inventory"""
     print("🏪 PANTRY INVENTORY")
@@ -19,10 +26,17 @@ def show_inventory():
     
     pantry = PantryManager()
     
+    # Fetch once and bucket by category and access level in a single pass
+    all_ingredients = pantry.list_ingredients()
+    by_category = defaultdict(list)
+    for ingredient in all_ingredients:
+        by_category[ingredient.category].append(ingredient)
+    access_counts = Counter(ingredient.access_level for ingredient in all_ingredients)
+    
     # Show by category
-    for category in IngredientCategory:
-        ingredients = pantry.list_ingredients(category)
-        print(f"\n📦 {category.value.upper()} ({len(ingredients)} ingredients)")
+    for category, title in _CATEGORY_TITLES:
+        ingredients = by_category.get(category, ())
+        print(f"\n{title} ({len(ingredients)} ingredients)")
         print("-" * 30)
         
         if ingredients:
@@ -38,19 +52,14 @@ def show_inventory():
             print("  (No ingredients)")
     
     # Show summary
-    all_ingredients = pantry.list_ingredients()
     print(f"\n📊 SUMMARY")
     print("-" * 30)
     print(f"Total ingredients: {len(all_ingredients)}")
     
     # Count by access level
-    public = [i for i in all_ingredients if i.access_level.value == "public"]
-    protected = [i for i in all_ingredients if i.access_level.value == "protected"]
-    admin = [i for i in all_ingredients if i.access_level.value == "admin"]
-    
-    print(f"Public: {len(public)}")
-    print(f"Protected: {len(protected)}")
-    print(f"Admin: {len(admin)}")
+    print(f"Public: {access_counts[AccessLevel.PUBLIC]}")
+    print(f"Protected: {access_counts[AccessLevel.PROTECTED]}")
+    print(f"Admin: {access_counts[AccessLevel.ADMIN]}")
 
 if __name__ == "__main__":
     show_inventory() 
\ No newline at end of file
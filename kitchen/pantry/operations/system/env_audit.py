@@ -7,8 +7,10 @@ meets all the prerequisites for running the kOS system.
 """
 import sys
 import shutil
+import functools
 import subprocess
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
 
 from kitchen.core.logging import get_logger
 
@@ -25,9 +27,14 @@ def _check_python_version() -> Dict[str, Any]:
     logger.info(f"Python version check: {status}. {message}")
     return {"check": "python_version", "status": status, "details": message}
 
+@functools.lru_cache(maxsize=32)
+def _which(command: str) -> Optional[str]:
+    """Resolves a command on PATH once per process."""
+    return shutil.which(command)
+
 def _check_command_exists(command: str) -> Dict[str, Any]:
     """Checks if a command-line tool is installed and available in the system's PATH."""
-    path = shutil.which(command)
+    path = _which(command)
     is_ok = path is not None
     status = "OK" if is_ok else "FAIL"
     message = f"Found at: {path}" if is_ok else f"'{command}' not found in system PATH."
@@ -36,11 +43,18 @@ def _check_command_exists(command: str) -> Dict[str, Any]:
 
 def _check_docker_running() -> Dict[str, Any]:
     """Checks if the Docker daemon is running and responsive."""
-    if not shutil.which("docker"):
+    if not _which("docker"):
         return {"check": "docker_daemon", "status": "FAIL", "details": "Docker command not found."}
     
     try:
-        subprocess.run(["docker", "info"], capture_output=True, text=True, check=True, timeout=10)
+        # Only the exit status matters; discard output instead of piping and decoding it
+        subprocess.run(
+            ["docker", "info"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            timeout=10,
+        )
         message = "Docker daemon is running."
         logger.info(f"Docker daemon check: OK. {message}")
         return {"check": "docker_daemon", "status": "OK", "details": message}
@@ -58,12 +72,15 @@ def run_audit() -> dict:
     """
     logger.info("--- Starting Environment Audit ---")
     
-    results = [
-        _check_python_version(),
-        _check_command_exists("docker"),
-        _check_command_exists("docker-compose"),
-        _check_docker_running(),
-    ]
+    # The checks are independent and IO-bound; run them concurrently, keeping report order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(_check_python_version),
+            executor.submit(_check_command_exists, "docker"),
+            executor.submit(_check_command_exists, "docker-compose"),
+            executor.submit(_check_docker_running),
+        ]
+        results = [future.result() for future in futures]
     
     failures = [res for res in results if res["status"] == "FAIL"]
     
@@ -6,25 +6,88 @@ This ingredient combines multiple docker-compose profile files into a single,
 cohesive docker-compose.yml file for execution. It requires the PyYAML package.
 """
 import os
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+import orjson
 import yaml  # PyYAML must be installed
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 from kitchen.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 def _merge_dicts(base: Dict, merge: Dict) -> Dict:
     """
-    Recursively merges two dictionaries. The `merge` dict's values
+    Deep-merges two dictionaries in place. The `merge` dict's values
     overwrite the `base` dict's values.
+
+    Uses an explicit stack rather than recursion. Nested dicts taken from
+    `merge` are rebuilt in `base`, so later merges never mutate them.
     """
-    for key, value in merge.items():
-        if isinstance(value, dict) and key in base and isinstance(base[key], dict):
-            base[key] = _merge_dicts(base[key], value)
-        else:
-            base[key] = value
+    stack = [(base, merge)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict):
+                existing = target.get(key)
+                if not isinstance(existing, dict):
+                    existing = target[key] = {}
+                stack.append((existing, value))
+            else:
+                target[key] = value
     return base
 
+def _load_profile(profile_path: str) -> Any:
+    """
+    Loads a profile YAML file, reusing a JSON copy while the file is unchanged.
+
+    The cache sits next to the profile as `<profile>.cache.json` and records the
+    source file's mtime and size. It holds plain data only, and profiles that do
+    not survive a JSON round trip unchanged (e.g. non-string keys or dates) are
+    not cached. Raises FileNotFoundError if the profile does not exist and
+    yaml.YAMLError on invalid YAML.
+    """
+    cache_path = profile_path + ".cache.json"
+    stat = os.stat(profile_path)
+    signature = [stat.st_mtime_ns, stat.st_size]
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = orjson.loads(f.read())
+        if cached["signature"] == signature:
+            return cached["data"]
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+        pass
+
+    with open(profile_path, 'r') as f:
+        profile_data = yaml.load(f, Loader=_Loader)
+
+    try:
+        blob = orjson.dumps({"signature": signature, "data": profile_data})
+    except TypeError:
+        return profile_data
+    if orjson.loads(blob)["data"] != profile_data:
+        return profile_data
+
+    try:
+        with open(cache_path, 'wb') as f:
+            f.write(blob)
+    except OSError as e:
+        logger.debug(f"Could not write profile cache {cache_path}: {e}")
+    return profile_data
+
+def _try_load_profile(profile_path: str) -> Tuple[Any, Optional[Exception]]:
+    """Loads a profile for use in a worker thread, returning (data, error) instead of raising."""
+    try:
+        return _load_profile(profile_path), None
+    except (FileNotFoundError, yaml.YAMLError) as e:
+        return None, e
+
 def build_from_profiles(profiles: List[str], output_file: str, docker_dir: str = "docker") -> Dict[str, Any]:
     """
     Generates a docker-compose.yml file from a list of service profiles.
@@ -46,29 +109,31 @@ def build_from_profiles(profiles: List[str], output_file: str, docker_dir: str =
 
     merged_config: Dict[str, Any] = {"version": "3.8", "services": {}, "volumes": {}, "networks": {}}
     
-    for profile in profiles:
-        profile_path = os.path.join(docker_dir, f"docker-compose.{profile}.yml")
-        if not os.path.exists(profile_path):
+    # Missing files surface as FileNotFoundError from the loader rather than a separate exists() check
+    profile_paths = [(profile, os.path.join(docker_dir, f"docker-compose.{profile}.yml")) for profile in profiles]
+
+    # Parse concurrently; merging below stays sequential to respect profile precedence
+    with ThreadPoolExecutor(max_workers=max(min(len(profile_paths), os.cpu_count() or 1), 1)) as executor:
+        parsed = list(executor.map(_try_load_profile, [path for _, path in profile_paths]))
+
+    for (profile, profile_path), (profile_data, error) in zip(profile_paths, parsed):
+        if isinstance(error, FileNotFoundError):
             logger.warning(f"Profile file not found, skipping: {profile_path}")
             continue
-        
-        try:
-            with open(profile_path, 'r') as f:
-                profile_data = yaml.safe_load(f)
-            
-            if profile_data:
-                merged_config = _merge_dicts(merged_config, profile_data)
-                logger.info(f"Successfully merged profile: {profile}")
-            else:
-                logger.warning(f"Profile file is empty, skipping: {profile_path}")
-
-        except yaml.YAMLError as e:
-            logger.error(f"Error parsing YAML from {profile_path}: {e}", exc_info=True)
+        if error is not None:
+            logger.error(f"Error parsing YAML from {profile_path}: {error}", exc_info=error)
             return {"status": "failure", "error": f"YAML error in {profile_path}"}
 
+        if profile_data:
+            merged_config = _merge_dicts(merged_config, profile_data)
+            logger.info(f"Successfully merged profile: {profile}")
+        else:
+            logger.warning(f"Profile file is empty, skipping: {profile_path}")
+
     try:
-        with open(output_file, 'w') as f:
-            yaml.dump(merged_config, f, default_flow_style=False, sort_keys=False)
+        # A 1 MiB buffer lets the whole compose file go out in a handful of writes
+        with open(output_file, 'w', buffering=1 << 20, encoding='utf-8') as f:
+            yaml.dump(merged_config, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
         logger.info(f"Successfully wrote merged docker-compose file to: {output_file}")
     except IOError as e:
         logger.error(f"Failed to write merged docker-compose file: {e}", exc_info=True)
@@ -7,12 +7,36 @@ services based on templates.
 """
 import os
 import shutil
-from typing import List, Dict, Any
+from typing import Iterator, List, Dict, Any
 
 from kitchen.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Directory names never searched for templates
+_IGNORED_DIRS = frozenset({"venv", ".venv", "node_modules", ".git", "__pycache__", "dist", "build"})
+
+def _iter_templates(directory: str) -> Iterator[str]:
+    """
+    Yields paths of `.env.template` files below a directory.
+
+    Uses os.scandir so entry types come from the directory listing, and never
+    descends into ignored directories. Unreadable directories are skipped.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _IGNORED_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(".env.template") and entry.is_file():
+                    yield entry.path
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from _iter_templates(subdir)
+
 def create_all_env_files(force_overwrite: bool = False) -> Dict[str, Any]:
     """
     Finds all `.env.template` files in the project and copies them to `.env` files.
@@ -29,27 +53,20 @@ def create_all_env_files(force_overwrite: bool = False) -> Dict[str, Any]:
     created_files: List[str] = []
     skipped_files: List[str] = []
 
-    for root, _, files in os.walk(project_root):
-        # Avoid traversing into virtual environments or node_modules
-        if "venv" in root or "node_modules" in root or ".git" in root:
-            continue
-            
-        for file in files:
-            if file.endswith(".env.template"):
-                template_path = os.path.join(root, file)
-                env_path = os.path.join(root, ".env")
-                
-                if not os.path.exists(env_path) or force_overwrite:
-                    try:
-                        shutil.copy(template_path, env_path)
-                        logger.info(f"Created .env file at: {env_path}")
-                        created_files.append(env_path)
-                    except IOError as e:
-                        logger.error(f"Failed to create .env file at {env_path}: {e}", exc_info=True)
-                        return {"status": "failure", "error": str(e)}
-                else:
-                    logger.info(f"Skipping existing .env file at: {env_path}")
-                    skipped_files.append(env_path)
+    for template_path in _iter_templates(project_root):
+        env_path = os.path.join(os.path.dirname(template_path), ".env")
+        
+        if not os.path.exists(env_path) or force_overwrite:
+            try:
+                shutil.copy(template_path, env_path)
+                logger.info(f"Created .env file at: {env_path}")
+                created_files.append(env_path)
+            except IOError as e:
+                logger.error(f"Failed to create .env file at {env_path}: {e}", exc_info=True)
+                return {"status": "failure", "error": str(e)}
+        else:
+            logger.info(f"Skipping existing .env file at: {env_path}")
+            skipped_files.append(env_path)
 
     logger.info(f"Finished .env file generation. Created: {len(created_files)}, Skipped: {len(skipped_files)}.")
     return {
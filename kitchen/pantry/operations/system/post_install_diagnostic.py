@@ -5,8 +5,10 @@ Pantry Ingredient for running post-installation diagnostics.
 This ingredient checks the health of the running services after they have
 been started by Docker Compose by pinging their health check endpoints.
 """
+import asyncio
+import random
 import time
-import requests
+import httpx
 from typing import Dict, List, Any
 
 from kitchen.core.logging import get_logger
@@ -22,11 +24,18 @@ SERVICES_TO_CHECK = {
     # "database": "...", # DB checks would require a different method (e.g., trying to connect)
 }
 
-def _check_service_health(service_name: str, url: str, timeout: int = 5) -> Dict[str, Any]:
+# (name, url) pairs snapshotted once so the retry loop doesn't rebuild dict views each round
+_SERVICES = tuple(SERVICES_TO_CHECK.items())
+
+# First retry delay in seconds; grows by 1.5x per round up to check_interval
+_INITIAL_RETRY_DELAY = 0.5
+
+async def _check_service_health(client: httpx.AsyncClient, service_name: str, url: str, timeout: int = 5) -> Dict[str, Any]:
     """
     Pings a single service endpoint to check its health.
 
     Args:
+        client: The shared async HTTP client.
         service_name: The name of the service being checked.
         url: The health check URL for the service.
         timeout: The timeout in seconds for the request.
@@ -35,62 +44,81 @@ def _check_service_health(service_name: str, url: str, timeout: int = 5) -> Dict
         A dictionary containing the status of the service.
     """
     try:
-        response = requests.get(url, timeout=timeout)
-        if response.ok:
+        response = await client.get(url, timeout=timeout)
+        if response.status_code < 400:
             logger.info(f"Health check PASSED for '{service_name}' at {url} (Status: {response.status_code})")
             return {"service": service_name, "status": "healthy", "statusCode": response.status_code}
         else:
             logger.warning(f"Health check FAILED for '{service_name}' at {url} (Status: {response.status_code})")
             return {"service": service_name, "status": "unhealthy", "statusCode": response.status_code}
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Health check FAILED for '{service_name}' at {url}. Could not connect: {e}")
         return {"service": service_name, "status": "unreachable", "error": str(e)}
 
 
-def run_checks(wait_time: int = 120, check_interval: int = 10) -> dict:
-    """
-    Runs health checks on all configured services, retrying until they are healthy or the wait_time expires.
-
-    Args:
-        wait_time: The total number of seconds to wait for services to become healthy.
-        check_interval: The number of seconds to wait between check attempts.
-
-    Returns:
-        A dictionary with the overall diagnostic results and status of each service.
-    """
+async def _run_checks_async(wait_time: int, check_interval: int) -> dict:
+    """Async implementation of run_checks sharing one client and connection pool."""
     logger.info("Executing post-installation diagnostics...")
     start_time = time.time()
     end_time = start_time + wait_time
     
     healthy_services = set()
     final_results = {}
-
-    while time.time() < end_time:
-        all_healthy = True
-        for service_name, url in SERVICES_TO_CHECK.items():
-            if service_name in healthy_services:
-                continue # Skip checks for already healthy services
-
-            result = _check_service_health(service_name, url)
-            final_results[service_name] = result
-
-            if result["status"] == "healthy":
-                healthy_services.add(service_name)
-            else:
-                all_healthy = False
-        
-        if all_healthy:
-            logger.info("All services are healthy!")
-            break
-
-        if time.time() < end_time:
-            logger.info(f"Not all services are healthy. Retrying in {check_interval} seconds...")
-            time.sleep(check_interval)
+    # Poll quickly at first, then back off towards check_interval for slow boots
+    delay = min(_INITIAL_RETRY_DELAY, check_interval)
+
+    # Checks are network-bound; ping services concurrently so a round takes max(latency), not sum
+    limits = httpx.Limits(max_keepalive_connections=32)
+    async with httpx.AsyncClient(limits=limits, follow_redirects=True) as client:
+        while time.time() < end_time:
+            all_healthy = True
+            pending = [
+                (service_name, url) for service_name, url in _SERVICES
+                if service_name not in healthy_services  # Skip checks for already healthy services
+            ]
+            if not pending:
+                break
+
+            results = await asyncio.gather(
+                *(_check_service_health(client, service_name, url) for service_name, url in pending)
+            )
+
+            for (service_name, _), result in zip(pending, results):
+                final_results[service_name] = result
+
+                if result["status"] == "healthy":
+                    healthy_services.add(service_name)
+                else:
+                    all_healthy = False
+            
+            if all_healthy:
+                logger.info("All services are healthy!")
+                break
+
+            if time.time() < end_time:
+                sleep_for = delay + random.uniform(0, delay * 0.1)
+                logger.info(f"Not all services are healthy. Retrying in {sleep_for:.1f} seconds...")
+                await asyncio.sleep(sleep_for)
+                delay = min(delay * 1.5, check_interval)
 
     # Final summary
-    if len(healthy_services) == len(SERVICES_TO_CHECK):
+    if len(healthy_services) == len(_SERVICES):
         logger.info("Diagnostics complete. All services reported as healthy.")
         return {"status": "success", "details": final_results}
     else:
         logger.error("Diagnostics complete. One or more services failed to become healthy.")
         return {"status": "failure", "details": final_results}
+
+
+def run_checks(wait_time: int = 120, check_interval: int = 10) -> dict:
+    """
+    Runs health checks on all configured services, retrying until they are healthy or the wait_time expires.
+
+    Args:
+        wait_time: The total number of seconds to wait for services to become healthy.
+        check_interval: The maximum number of seconds to wait between check attempts.
+
+    Returns:
+        A dictionary with the overall diagnostic results and status of each service.
+    """
+    return asyncio.run(_run_checks_async(wait_time, check_interval))
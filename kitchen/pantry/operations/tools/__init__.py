@@ -9,13 +9,18 @@ __version__ = "1.0.0"
 __author__ = "kOS Kitchen System"
 __description__ = "Modular utility tools for pantry operations"
 
-# Import modular tool operations
-from .file_reader import FileReader
-from .file_writer import FileWriter
-from .file_checker import FileChecker
-from .file_deleter import FileDeleter
-from .file_copier import FileCopier
-from .directory_lister import DirectoryLister
+import importlib
+
+# Tools are imported on first attribute access (PEP 562) so importing the package
+# doesn't pull in every tool module and its dependencies
+_LAZY_IMPORTS = {
+    "FileReader": ".file_utils.file_reader",
+    "FileWriter": ".file_utils.file_writer",
+    "FileChecker": ".file_utils.file_checker",
+    "FileDeleter": ".file_utils.file_deleter",
+    "FileCopier": ".file_utils.file_copier",
+    "DirectoryLister": ".directory_lister",
+}
 
 __all__ = [
     "FileReader",
@@ -24,4 +29,17 @@ __all__ = [
     "FileDeleter",
     "FileCopier",
     "DirectoryLister"
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
\ No newline at end of file
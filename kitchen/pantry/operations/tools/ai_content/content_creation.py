@@ -5,7 +5,7 @@ Single-purpose module for content creation workflows.
 """
 
 from typing import Dict, Any
-from datetime import datetime
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -31,7 +31,7 @@ class ContentCreationModule:
                     "Publish"
                 ],
                 'estimated_duration': "4 hours",
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
             }
         except Exception as e:
             logger.error(f"Error creating content pipeline: {str(e)}")
@@ -5,7 +5,7 @@ Single-purpose module for generating AI content (mocked real LLM call for now).
 """
 
 from typing import Dict, Any
-from datetime import datetime
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,7 +25,7 @@ class AIContentGenerator:
                 'prompt': prompt,
                 'length': length,
                 'generated_content': f"[AI generated {content_type}]: {prompt}",
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
             }
         except Exception as e:
             logger.error(f"Error generating content: {str(e)}")
@@ -5,7 +5,7 @@ Single-purpose module for optimizing AI content (mocked real LLM call for now).
 """
 
 from typing import Dict, Any
-from datetime import datetime
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,7 +24,7 @@ class AIContentOptimizer:
                 'original_content': content,
                 'target_audience': target_audience,
                 'optimized_content': f"[Optimized for {target_audience}]: {content}",
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
             }
         except Exception as e:
             logger.error(f"Error optimizing content: {str(e)}")
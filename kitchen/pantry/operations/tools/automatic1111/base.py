@@ -0,0 +1,111 @@
+"""
+Automatic1111 Client Base
+
+Shared HTTP plumbing for the Automatic1111 operations.
+"""
+
+from typing import Dict, Any, Optional
+import time
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+import base64
+import orjson
+import logging
+
+logger = logging.getLogger(__name__)
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+class Automatic1111Base:
+    """Connection handling and response unpacking shared by the Automatic1111 operations"""
+    
+    def __init__(self, base_url: str = "http://localhost:7860"):
+        self.base_url = base_url.rstrip('/')
+        self.api_url = f"{self.base_url}/sdapi/v1"
+        
+        # Reuse keep-alive connections across calls instead of reconnecting per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+    
+    def _unpack(self, endpoint: str, result: Dict[str, Any], prompt: str, negative_prompt: str,
+                parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape an API response into the operation result"""
+        # Decode base64 image data
+        if 'images' in result and len(result['images']) > 0:
+            image_data = base64.b64decode(result['images'][0], validate=False)
+            parameters['seed'] = result.get('info', {}).get('seed', parameters.get('seed'))
+            
+            return {
+                'success': True,
+                'operation': endpoint,
+                'prompt': prompt,
+                'negative_prompt': negative_prompt,
+                'parameters': parameters,
+                'image_data': image_data,
+                'image_format': 'png',
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+            }
+        else:
+            return {
+                'success': False,
+                'error': 'No image generated',
+                'operation': endpoint
+            }
+    
+    def _failure(self, endpoint: str, error: Exception, request_failed: bool) -> Dict[str, Any]:
+        """Log and shape an error result"""
+        if request_failed:
+            logger.error(f"Error calling Automatic1111 API: {str(error)}")
+            message = f"API request failed: {str(error)}"
+        else:
+            logger.error(f"Error running {endpoint}: {str(error)}")
+            message = str(error)
+        return {
+            'success': False,
+            'error': message,
+            'operation': endpoint
+        }
+    
+    def _post_and_unpack(self, endpoint: str, payload: Dict[str, Any], prompt: str,
+                         negative_prompt: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a generation request and unpack the first returned image"""
+        try:
+            # orjson serializes straight to bytes and parses the raw response body,
+            # avoiding extra copies of the base64 image text in both directions
+            response = self._session.post(f"{self.api_url}/{endpoint}", data=orjson.dumps(payload),
+                                          headers=_JSON_HEADERS)
+            response.raise_for_status()
+            
+            result = orjson.loads(response.content)
+            return self._unpack(endpoint, result, prompt, negative_prompt, parameters)
+        
+        except requests.exceptions.RequestException as e:
+            return self._failure(endpoint, e, request_failed=True)
+        except Exception as e:
+            return self._failure(endpoint, e, request_failed=False)
+    
+    async def _post_and_unpack_async(self, endpoint: str, payload: Dict[str, Any], prompt: str,
+                                     negative_prompt: str, parameters: Dict[str, Any],
+                                     client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
+        """Async counterpart of _post_and_unpack; opens a client for the call if none is given"""
+        try:
+            body = orjson.dumps(payload)
+            if client is None:
+                async with httpx.AsyncClient(timeout=None) as own_client:
+                    response = await own_client.post(f"{self.api_url}/{endpoint}", content=body,
+                                                     headers=_JSON_HEADERS)
+            else:
+                response = await client.post(f"{self.api_url}/{endpoint}", content=body,
+                                             headers=_JSON_HEADERS)
+            response.raise_for_status()
+            
+            result = orjson.loads(response.content)
+            return self._unpack(endpoint, result, prompt, negative_prompt, parameters)
+        
+        except httpx.HTTPError as e:
+            return self._failure(endpoint, e, request_failed=True)
+        except Exception as e:
+            return self._failure(endpoint, e, request_failed=False)
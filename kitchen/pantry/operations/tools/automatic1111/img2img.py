@@ -5,85 +5,68 @@ Single-purpose module for Automatic1111 img2img operations.
 """
 
 from typing import Dict, Any, Optional
-from datetime import datetime
-import requests
 import base64
-import json
+import httpx
 import logging
 
+from .base import Automatic1111Base
+
 logger = logging.getLogger(__name__)
 
-class Automatic1111Img2Img:
+class Automatic1111Img2Img(Automatic1111Base):
     """Automatic1111 image-to-image operation"""
     
-    def __init__(self, base_url: str = "http://localhost:7860"):
-        self.base_url = base_url.rstrip('/')
-        self.api_url = f"{self.base_url}/sdapi/v1"
+    def _build_request(self, init_image: bytes, prompt: str, negative_prompt: str,
+                       denoising_strength: float, steps: int, cfg_scale: float,
+                       sampler_name: str, seed: int):
+        """Build the img2img payload and the parameters echoed in the result"""
+        # Encode image to base64; the output is pure ASCII, so skip the UTF-8 codec
+        init_image_b64 = base64.b64encode(init_image).decode('ascii')
+        
+        payload = {
+            "init_images": [init_image_b64],
+            "prompt": prompt,
+            "negative_prompt": negative_prompt,
+            "denoising_strength": denoising_strength,
+            "steps": steps,
+            "cfg_scale": cfg_scale,
+            "sampler_name": sampler_name,
+            "seed": seed,
+            "batch_size": 1,
+            # Return the image inline without also writing it to the server's outputs dir
+            "send_images": True,
+            "save_images": False
+        }
+        parameters = {
+            'denoising_strength': denoising_strength,
+            'steps': steps,
+            'cfg_scale': cfg_scale,
+            'sampler_name': sampler_name,
+            'seed': seed
+        }
+        return payload, parameters
     
     def transform_image(self, init_image: bytes, prompt: str, negative_prompt: str = "",
                        denoising_strength: float = 0.75, steps: int = 20, 
                        cfg_scale: float = 7.0, sampler_name: str = "Euler a", 
                        seed: int = -1) -> Dict[str, Any]:
         """Transform image using text prompt and Automatic1111"""
-        try:
-            # Encode image to base64
-            init_image_b64 = base64.b64encode(init_image).decode('utf-8')
-            
-            payload = {
-                "init_images": [init_image_b64],
-                "prompt": prompt,
-                "negative_prompt": negative_prompt,
-                "denoising_strength": denoising_strength,
-                "steps": steps,
-                "cfg_scale": cfg_scale,
-                "sampler_name": sampler_name,
-                "seed": seed,
-                "batch_size": 1
-            }
-            
-            response = requests.post(f"{self.api_url}/img2img", json=payload)
-            response.raise_for_status()
-            
-            result = response.json()
-            
-            # Decode base64 image data
-            if 'images' in result and len(result['images']) > 0:
-                image_data = base64.b64decode(result['images'][0])
-                
-                return {
-                    'success': True,
-                    'operation': 'img2img',
-                    'prompt': prompt,
-                    'negative_prompt': negative_prompt,
-                    'parameters': {
-                        'denoising_strength': denoising_strength,
-                        'steps': steps,
-                        'cfg_scale': cfg_scale,
-                        'sampler_name': sampler_name,
-                        'seed': result.get('info', {}).get('seed', seed)
-                    },
-                    'image_data': image_data,
-                    'image_format': 'png',
-                    'timestamp': datetime.now().isoformat()
-                }
-            else:
-                return {
-                    'success': False,
-                    'error': 'No image generated',
-                    'operation': 'img2img'
-                }
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error calling Automatic1111 API: {str(e)}")
-            return {
-                'success': False,
-                'error': f"API request failed: {str(e)}",
-                'operation': 'img2img'
-            }
-        except Exception as e:
-            logger.error(f"Error transforming image: {str(e)}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operation': 'img2img'
-            } 
\ No newline at end of file
+        payload, parameters = self._build_request(init_image, prompt, negative_prompt, denoising_strength,
+                                                  steps, cfg_scale, sampler_name, seed)
+        return self._post_and_unpack("img2img", payload, prompt, negative_prompt, parameters)
+    
+    async def transform_image_async(self, init_image: bytes, prompt: str, negative_prompt: str = "",
+                                    denoising_strength: float = 0.75, steps: int = 20,
+                                    cfg_scale: float = 7.0, sampler_name: str = "Euler a",
+                                    seed: int = -1,
+                                    client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
+        """
+        Async variant of transform_image for running many transforms concurrently.
+        
+        Pass a shared httpx.AsyncClient to pool connections across calls, e.g. when
+        fanning out with asyncio.gather; otherwise a client is opened for this call.
+        """
+        payload, parameters = self._build_request(init_image, prompt, negative_prompt, denoising_strength,
+                                                  steps, cfg_scale, sampler_name, seed)
+        return await self._post_and_unpack_async("img2img", payload, prompt, negative_prompt,
+                                                 parameters, client)
\ No newline at end of file
@@ -5,7 +5,7 @@ Single-purpose module for checking calendar availability (mocked real API call f
 """
 
 from typing import Dict, Any
-from datetime import datetime
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,7 +24,7 @@ class CalendarAvailabilityChecker:
                 'start_time': start_time,
                 'end_time': end_time,
                 'available': True,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
             }
         except Exception as e:
             logger.error(f"Error checking availability: {str(e)}")
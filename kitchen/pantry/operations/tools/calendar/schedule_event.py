@@ -5,7 +5,7 @@ Single-purpose module for scheduling calendar events (mocked real API call for n
 """
 
 from typing import Dict, Any, List
-from datetime import datetime
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,8 +25,8 @@ class CalendarEventScheduler:
                 'start_time': start_time,
                 'end_time': end_time,
                 'attendees': attendees,
-                'event_id': f"event_{int(datetime.now().timestamp())}",
-                'timestamp': datetime.now().isoformat()
+                'event_id': f"event_{int(time.time())}",
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
             }
         except Exception as e:
             logger.error(f"Error scheduling event: {str(e)}")
@@ -5,34 +5,53 @@ Single-purpose module for ComfyUI workflow execution operations.
 """
 
 from typing import Dict, Any, Optional
-from datetime import datetime
+import time
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
 import logging
+from websockets.sync.client import connect as ws_connect
 
 logger = logging.getLogger(__name__)
 
 class ComfyUIWorkflowExecutor:
     """ComfyUI workflow execution operation"""
     
-    def __init__(self, base_url: str = "http://localhost:8188"):
+    def __init__(self, base_url: str = "http://localhost:8188", execution_timeout: float = 600.0):
         self.base_url = base_url.rstrip('/')
         self.api_url = f"{self.base_url}/api"
+        # http:// -> ws://, https:// -> wss://
+        self.ws_url = f"ws{self.base_url[4:]}/ws" if self.base_url.startswith("http") else f"{self.base_url}/ws"
+        self.execution_timeout = execution_timeout
+        
+        # Reuse keep-alive connections across calls instead of reconnecting per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
     
     def execute_workflow(self, workflow_data: Dict[str, Any], 
                         client_id: str = "kitchen_pantry") -> Dict[str, Any]:
         """Execute a ComfyUI workflow"""
+        ws = None
         try:
+            # Subscribe before queuing so no progress events are missed
+            try:
+                ws = ws_connect(f"{self.ws_url}?clientId={client_id}", open_timeout=10)
+            except Exception as e:
+                logger.warning(f"ComfyUI WebSocket unavailable, reading history without waiting: {str(e)}")
+            
             # Queue the workflow
             queue_payload = {
                 "prompt": workflow_data,
                 "client_id": client_id
             }
             
-            response = requests.post(f"{self.api_url}/prompt", json=queue_payload)
+            response = self._session.post(f"{self.api_url}/prompt", data=orjson.dumps(queue_payload),
+                                          headers={'Content-Type': 'application/json'})
             response.raise_for_status()
             
-            result = response.json()
+            result = orjson.loads(response.content)
             prompt_id = result.get('prompt_id')
             
             if not prompt_id:
@@ -43,7 +62,7 @@ class ComfyUIWorkflowExecutor:
                 }
             
             # Monitor execution status
-            execution_result = self._monitor_execution(prompt_id, client_id)
+            execution_result = self._monitor_execution(prompt_id, client_id, ws)
             
             return {
                 'success': True,
@@ -51,7 +70,7 @@ class ComfyUIWorkflowExecutor:
                 'prompt_id': prompt_id,
                 'client_id': client_id,
                 'execution_result': execution_result,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
             }
                 
         except requests.exceptions.RequestException as e:
@@ -68,15 +87,52 @@ class ComfyUIWorkflowExecutor:
                 'error': str(e),
                 'operation': 'execute_workflow'
             }
+        finally:
+            if ws is not None:
+                ws.close()
+    
+    def _wait_for_completion(self, ws, prompt_id: str) -> Optional[str]:
+        """Block on WebSocket events until the prompt finishes; returns an error message on failure"""
+        deadline = time.monotonic() + self.execution_timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return f"Timed out after {self.execution_timeout}s waiting for prompt {prompt_id}"
+            
+            try:
+                message = ws.recv(timeout=remaining)
+            except TimeoutError:
+                continue
+            if not isinstance(message, str):
+                continue  # binary preview frames
+            
+            event = orjson.loads(message)
+            data = event.get('data', {})
+            if data.get('prompt_id') != prompt_id:
+                continue
+            
+            event_type = event.get('type')
+            if event_type == 'executing' and data.get('node') is None:
+                return None
+            if event_type == 'execution_error':
+                return data.get('exception_message', 'Workflow execution failed')
     
-    def _monitor_execution(self, prompt_id: str, client_id: str) -> Dict[str, Any]:
-        """Monitor workflow execution status"""
+    def _monitor_execution(self, prompt_id: str, client_id: str, ws=None) -> Dict[str, Any]:
+        """Wait for the workflow to finish, then fetch its history once"""
         try:
+            if ws is not None:
+                error = self._wait_for_completion(ws, prompt_id)
+                if error:
+                    return {
+                        'status': 'error',
+                        'error': error
+                    }
+            
             # Get execution status
-            response = requests.get(f"{self.api_url}/history/{prompt_id}")
+            response = self._session.get(f"{self.api_url}/history/{prompt_id}")
             response.raise_for_status()
             
-            history = response.json()
+            history = orjson.loads(response.content)
             
             return {
                 'status': 'completed',
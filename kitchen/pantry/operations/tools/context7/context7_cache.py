@@ -9,33 +9,64 @@ Version: 1.0.0
 Created: 2025-07-08T11:15:00Z
 """
 
-import json
 import logging
-from datetime import datetime
+import sqlite3
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+import orjson
+
+# Supported cache_duration settings in seconds; anything else falls back to 24 hours
+_CACHE_DURATIONS = {
+    "1_hour": 3600,
+    "12_hours": 12 * 3600,
+    "24_hours": 24 * 3600,
+}
 
 
 class Context7Cache:
-    """Cache manager for Context7 API responses."""
+    """Cache manager for Context7 API responses, backed by a single SQLite database."""
     
-    def __init__(self, cache_dir: Path, enabled: bool = True, cache_duration: str = "24_hours"):
+    def __init__(self, cache_dir: Path, enabled: bool = True, cache_duration: str = "24_hours",
+                 memory_size: int = 256):
         """
         Initialize the cache manager.
         
         Args:
-            cache_dir: Directory to store cache files
+            cache_dir: Directory holding the cache database
             enabled: Whether caching is enabled
             cache_duration: Cache duration (e.g., "24_hours")
+            memory_size: Number of hot entries kept in memory in front of the database
         """
         self.cache_dir = cache_dir
         self.enabled = enabled
         self.cache_duration = cache_duration
+        self._duration_seconds = _CACHE_DURATIONS.get(cache_duration, _CACHE_DURATIONS["24_hours"])
         self.logger = logging.getLogger('context7_cache')
+        self.db_path = self.cache_dir / "cache.sqlite"
+        self.conn: Optional[sqlite3.Connection] = None
+        
+        # LRU of recently used entries: key -> (cached_at, payload). Payloads stay as
+        # orjson bytes so every hit decodes a fresh dict that callers may mutate freely.
+        self._mem: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._mem_max = memory_size
         
-        # Create cache directory if it doesn't exist
+        # Create cache directory and database if they don't exist
         if self.enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    cached_at INTEGER NOT NULL,
+                    payload BLOB NOT NULL
+                )
+            """)
+            self._sweep_expired()
     
     def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """
@@ -50,21 +81,28 @@ class Context7Cache:
         if not self.enabled:
             return None
         
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
-                
-                # Check if cache is still valid
-                if self._is_cache_valid(cached_data):
-                    return cached_data.get("data")
-                else:
-                    # Remove expired cache
-                    cache_file.unlink()
-                    self.logger.info(f"Removed expired cache: {cache_key}")
-            except Exception as e:
-                self.logger.warning(f"Failed to read cache {cache_key}: {e}")
+        hit = self._mem.get(cache_key)
+        if hit is not None:
+            cached_at, payload = hit
+            if self._is_cache_valid(cached_at):
+                self._mem.move_to_end(cache_key)
+                return orjson.loads(payload)
+            del self._mem[cache_key]
+        
+        try:
+            row = self.conn.execute(
+                "SELECT payload, cached_at FROM cache WHERE key = ?", (cache_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            payload, cached_at = row
+            # Check if cache is still valid; expired rows are left for _sweep_expired
+            if self._is_cache_valid(cached_at):
+                self._remember(cache_key, cached_at, payload)
+                return orjson.loads(payload)
+        except Exception as e:
+            self.logger.warning(f"Failed to read cache {cache_key}: {e}")
         
         return None
     
@@ -80,62 +118,57 @@ class Context7Cache:
             return
         
         try:
-            cache_file = self.cache_dir / f"{cache_key}.json"
-            cache_data = {
-                "data": data,
-                "cached_at": datetime.utcnow().isoformat() + "Z",
-                "cache_duration": self.cache_duration
-            }
-            
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            cached_at = int(time.time())
+            payload = orjson.dumps(data)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache (key, cached_at, payload) VALUES (?, ?, ?)",
+                (cache_key, cached_at, payload)
+            )
+            self._remember(cache_key, cached_at, payload)
             
             self.logger.info(f"Cached data for key: {cache_key}")
                 
         except Exception as e:
             self.logger.warning(f"Failed to save cache {cache_key}: {e}")
     
-    def _is_cache_valid(self, cached_data: Dict[str, Any]) -> bool:
+    def _sweep_expired(self) -> None:
+        """Delete every expired entry in one statement, keeping that work off the read path."""
+        try:
+            deleted = self.conn.execute(
+                "DELETE FROM cache WHERE cached_at <= ?", (time.time() - self._duration_seconds,)
+            ).rowcount
+            if deleted:
+                self.logger.info(f"Removed {deleted} expired cache entries")
+        except Exception as e:
+            self.logger.warning(f"Failed to sweep expired cache: {e}")
+    
+    def _remember(self, cache_key: str, cached_at: float, payload: bytes) -> None:
+        """Store an encoded entry in the in-memory LRU, evicting the least recently used."""
+        self._mem[cache_key] = (cached_at, payload)
+        self._mem.move_to_end(cache_key)
+        if len(self._mem) > self._mem_max:
+            self._mem.popitem(last=False)
+    
+    def _is_cache_valid(self, cached_at: int) -> bool:
         """
         Check if cache is still valid.
         
         Args:
-            cached_data: Cached data dictionary
+            cached_at: Unix timestamp the entry was stored at
             
         Returns:
             True if cache is valid, False otherwise
         """
-        try:
-            cached_at = datetime.fromisoformat(cached_data.get("cached_at", "").replace("Z", "+00:00"))
-            now = datetime.utcnow()
-            
-            # Parse cache duration
-            if self.cache_duration == "24_hours":
-                duration_hours = 24
-            elif self.cache_duration == "1_hour":
-                duration_hours = 1
-            elif self.cache_duration == "12_hours":
-                duration_hours = 12
-            else:
-                # Default to 24 hours
-                duration_hours = 24
-            
-            # Check if cache is expired
-            time_diff = now - cached_at.replace(tzinfo=None)
-            return time_diff.total_seconds() < (duration_hours * 3600)
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to validate cache: {e}")
-            return False
+        return time.time() - cached_at < self._duration_seconds
     
     def clear(self) -> None:
         """Clear all cached data."""
         if not self.enabled:
             return
         
+        self._mem.clear()
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+            self.conn.execute("DELETE FROM cache")
             self.logger.info("Cleared all cached data")
         except Exception as e:
             self.logger.warning(f"Failed to clear cache: {e}")
@@ -151,17 +184,19 @@ class Context7Cache:
             return {"enabled": False}
         
         try:
-            cache_files = list(self.cache_dir.glob("*.json"))
-            total_size = sum(f.stat().st_size for f in cache_files)
+            total_entries, total_size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(payload)), 0) FROM cache"
+            ).fetchone()
             
             return {
                 "enabled": True,
                 "cache_directory": str(self.cache_dir),
+                "cache_database": str(self.db_path),
                 "cache_duration": self.cache_duration,
-                "total_files": len(cache_files),
+                "total_entries": total_entries,
                 "total_size_bytes": total_size,
                 "total_size_mb": round(total_size / (1024 * 1024), 2)
             }
         except Exception as e:
             self.logger.warning(f"Failed to get cache stats: {e}")
-            return {"enabled": True, "error": str(e)} 
\ No newline at end of file
+            return {"enabled": True, "error": str(e)}
\ No newline at end of file
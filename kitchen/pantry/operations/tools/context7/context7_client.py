@@ -11,6 +11,8 @@ Created: 2025-07-08T10:25:00Z
 Updated: 2025-07-08T11:15:00Z
 """
 
+import copy
+import hashlib
 import json
 import logging
 import subprocess
@@ -25,6 +27,40 @@ from .context7_mcp import Context7MCPExecutor
 
 logger = logging.getLogger(__name__)
 
+_logging_configured = False
+
+
+def _configure_logging() -> None:
+    """Attach console and file handlers to the context7_client logger, once per process."""
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+    
+    client_logger = logging.getLogger('context7_client')
+    client_logger.setLevel(logging.INFO)
+    
+    if not client_logger.handlers:
+        # Console handler
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        
+        # File handler
+        log_dir = Path("logs")
+        log_dir.mkdir(exist_ok=True)
+        file_handler = logging.FileHandler(log_dir / "context7_client.log")
+        file_handler.setLevel(logging.DEBUG)
+        
+        # Formatter
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        console_handler.setFormatter(formatter)
+        file_handler.setFormatter(formatter)
+        
+        client_logger.addHandler(console_handler)
+        client_logger.addHandler(file_handler)
+
 
 class Context7Client:
     """
@@ -44,7 +80,8 @@ class Context7Client:
         Args:
             config_path: Path to Context7 configuration file
         """
-        self.logger = self._setup_logging()
+        _configure_logging()
+        self.logger = logging.getLogger('context7_client')
         self.logger.info("Initializing Context7 MCP Client")
         
         # Load configuration
@@ -68,35 +105,10 @@ class Context7Client:
         # Initialize MCP executor
         self.mcp_executor = Context7MCPExecutor()
         
-        self.logger.info("Context7 MCP Client initialized successfully")
-    
-    def _setup_logging(self) -> logging.Logger:
-        """Setup logging for the Context7 client."""
-        logger = logging.getLogger('context7_client')
-        logger.setLevel(logging.INFO)
-        
-        if not logger.handlers:
-            # Console handler
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
-            
-            # File handler
-            log_dir = Path("logs")
-            log_dir.mkdir(exist_ok=True)
-            file_handler = logging.FileHandler(log_dir / "context7_client.log")
-            file_handler.setLevel(logging.DEBUG)
-            
-            # Formatter
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            console_handler.setFormatter(formatter)
-            file_handler.setFormatter(formatter)
-            
-            logger.addHandler(console_handler)
-            logger.addHandler(file_handler)
+        # Cache-miss requests currently being fetched, keyed by cache key
+        self._inflight: Dict[str, asyncio.Future] = {}
         
-        return logger
+        self.logger.info("Context7 MCP Client initialized successfully")
     
     def _load_config(self, config_path: Optional[Union[str, Path]]) -> Dict[str, Any]:
         """Load Context7 configuration."""
@@ -140,6 +152,74 @@ class Context7Client:
         self.logger.info("Using default Context7 configuration")
         return default_config
     
+    def _cache_key(self, prefix: str, *parts: Any) -> str:
+        """
+        Build a fixed-width cache key from request parameters.
+        
+        Library IDs and topics may contain '/', '@' or spaces, so the parts are hashed
+        rather than pasted into the key; the prefix keeps keys readable.
+        
+        Args:
+            prefix: Request type, e.g. "resolve" or "docs"
+            parts: Request parameters identifying the response
+            
+        Returns:
+            Cache key of the form "<prefix>_<32 hex chars>"
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(str(part).encode('utf-8'))
+            digest.update(b"\x00")  # separator so ("ab", "c") and ("a", "bc") differ
+        return f"{prefix}_{digest.hexdigest()}"
+    
+    async def _fetch(self, cache_key: str, mcp_request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute an MCP request and cache the result, coalescing concurrent duplicates.
+        
+        A caller that misses the cache while the same key is already being fetched
+        awaits that fetch instead of starting another MCP process. Joining callers
+        are shielded so that cancelling one of them does not cancel the shared
+        fetch, and each receives its own copy of the result.
+        
+        Args:
+            cache_key: Cache key identifying the request
+            mcp_request: MCP request dictionary
+            
+        Returns:
+            MCP response result
+        """
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            return copy.deepcopy(await asyncio.shield(inflight))
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            # Wait for rate limit capacity; cache hits don't count against it
+            await self.rate_limiter.acquire()
+            
+            # Execute Context7 command
+            command = self.mcp_executor.get_context7_command()
+            args = ["-y", "@upstash/context7-mcp@latest"]
+            result = await self.mcp_executor.execute_mcp_command(command, args, mcp_request)
+            
+            # Cache result
+            self.cache.save(cache_key, result)
+            if not future.done():
+                # Joiners copy from a snapshot the owner's caller cannot mutate
+                future.set_result(copy.deepcopy(result))
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # mark retrieved in case nobody else was waiting
+            raise
+        finally:
+            del self._inflight[cache_key]
+    
     async def resolve_library_id(self, library_name: str) -> Dict[str, Any]:
         """
         Resolve a general library name into a Context7-compatible library ID.
@@ -151,29 +231,18 @@ class Context7Client:
             Dictionary with library ID and confidence score
         """
         try:
-            # Check rate limit
-            if not self.rate_limiter.can_proceed():
-                raise Exception("Rate limit exceeded")
-            
             # Check cache first
-            cache_key = f"resolve_{library_name.lower()}"
+            cache_key = self._cache_key("resolve", library_name.lower())
             cached_result = self.cache.get(cache_key)
             if cached_result:
                 self.logger.info(f"Returning cached library ID for {library_name}")
                 return cached_result
             
-            # Execute Context7 command
-            command = self.mcp_executor.get_context7_command()
-            args = ["-y", "@upstash/context7-mcp@latest"]
-            
             # Create MCP request
             mcp_request = self.mcp_executor.create_resolve_request(library_name)
             
-            # Execute command
-            result = await self.mcp_executor.execute_mcp_command(command, args, mcp_request)
-            
-            # Cache result
-            self.cache.save(cache_key, result)
+            # Execute command, sharing the call with any identical request already in flight
+            result = await self._fetch(cache_key, mcp_request)
             
             self.logger.info(f"Resolved library ID for {library_name}: {result}")
             return result
@@ -199,29 +268,18 @@ class Context7Client:
             Dictionary with documentation content and metadata
         """
         try:
-            # Check rate limit
-            if not self.rate_limiter.can_proceed():
-                raise Exception("Rate limit exceeded")
-            
             # Check cache first
-            cache_key = f"docs_{library_id}_{topic}_{tokens}"
+            cache_key = self._cache_key("docs", library_id, topic, tokens)
             cached_result = self.cache.get(cache_key)
             if cached_result:
                 self.logger.info(f"Returning cached documentation for {library_id}")
                 return cached_result
             
-            # Execute Context7 command
-            command = self.mcp_executor.get_context7_command()
-            args = ["-y", "@upstash/context7-mcp@latest"]
-            
             # Create MCP request
             mcp_request = self.mcp_executor.create_docs_request(library_id, topic, tokens)
             
-            # Execute command
-            result = await self.mcp_executor.execute_mcp_command(command, args, mcp_request)
-            
-            # Cache result
-            self.cache.save(cache_key, result)
+            # Execute command, sharing the call with any identical request already in flight
+            result = await self._fetch(cache_key, mcp_request)
             
             self.logger.info(f"Fetched documentation for {library_id}")
             return result
@@ -238,6 +296,10 @@ class Context7Client:
     
 
     
+    async def close(self) -> None:
+        """Shut down the MCP server process kept running between requests."""
+        await self.mcp_executor.close()
+    
     async def health_check(self) -> Dict[str, Any]:
         """Perform health check on Context7 service."""
         try:
@@ -9,11 +9,51 @@ Version: 1.0.0
 Created: 2025-07-08T11:20:00Z
 """
 
+import itertools
 import json
 import logging
-import subprocess
+import os
+import shutil
+import signal
 import asyncio
-from typing import Dict, List, Any
+import weakref
+from collections import deque
+from typing import Deque, Dict, List, Any, Optional, Tuple
+
+# Package managers able to run the Context7 MCP package, in order of preference
+_PACKAGE_MANAGERS = ("bunx", "npx", "yarn", "pnpm")
+
+# Response lines can carry whole documentation pages; raise asyncio's 64 KiB line limit
+_STREAM_LIMIT = 16 * 1024 * 1024
+
+# Recent stderr lines kept from the persistent server, reported if it exits
+_STDERR_TAIL_LINES = 20
+
+_INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "kos-kitchen", "version": "1.0.0"}
+    }
+}
+
+
+class _SessionError(Exception):
+    """The persistent MCP server process could not be started or went away."""
+
+
+def _kill_processes(processes: List[asyncio.subprocess.Process]) -> None:
+    """Kill session processes still running when their executor is collected or at exit."""
+    for proc in processes:
+        if proc.returncode is None:
+            # Signal the pid directly; the process's event loop may already be closed
+            try:
+                os.kill(proc.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+    processes.clear()
 
 
 class Context7MCPExecutor:
@@ -22,6 +62,32 @@ class Context7MCPExecutor:
     def __init__(self):
         """Initialize the MCP executor."""
         self.logger = logging.getLogger('context7_mcp')
+        self._cached_command: Optional[str] = None
+        
+        # Long-lived MCP server process, started on first request and shared by later ones
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._session_key: Optional[Tuple[str, ...]] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_ready: Optional[asyncio.Future] = None
+        self._persistent_disabled = False
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._stderr_tail: Deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+        
+        # Kill a session process left running when the executor is dropped or the
+        # interpreter exits; the list holds the live process without referencing self
+        self._live_processes: List[asyncio.subprocess.Process] = []
+        self._finalizer = weakref.finalize(self, _kill_processes, self._live_processes)
+    
+    async def __aenter__(self) -> "Context7MCPExecutor":
+        """Use the executor as an async context manager that closes its session."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Shut down the persistent MCP session on leaving the context."""
+        await self.close()
     
     def get_context7_command(self) -> str:
         """
@@ -30,18 +96,16 @@ class Context7MCPExecutor:
         Returns:
             Available package manager command
         """
-        # Try different package managers in order of preference
-        package_managers = ["bunx", "npx", "yarn", "pnpm"]
+        if self._cached_command:
+            return self._cached_command
         
-        for pm in package_managers:
-            try:
-                # Check if package manager is available
-                result = subprocess.run([pm, "--version"], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    self.logger.info(f"Using package manager: {pm}")
-                    return pm
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                continue
+        # Try different package managers in order of preference
+        for pm in _PACKAGE_MANAGERS:
+            # A PATH lookup is enough to tell the manager is installed; no need to fork it
+            if shutil.which(pm):
+                self.logger.info(f"Using package manager: {pm}")
+                self._cached_command = pm
+                return pm
         
         # Default to npx
         self.logger.warning("No package manager found, defaulting to npx")
@@ -51,6 +115,9 @@ class Context7MCPExecutor:
         """
         Execute MCP command and return result.
         
+        Requests go to a persistent MCP server process. If that process cannot be
+        started, this and later requests fall back to one process per request.
+        
         Args:
             command: Package manager command
             args: Command arguments
@@ -63,42 +130,220 @@ class Context7MCPExecutor:
             Exception: If command execution fails
         """
         try:
-            # Prepare the full command
-            full_command = [command] + args
+            if not self._persistent_disabled:
+                try:
+                    return await self._execute_persistent(command, args, mcp_request)
+                except _SessionError as e:
+                    self.logger.warning(f"Persistent MCP session unavailable, running a one-off process: {e}")
+            return await self._execute_once(command, args, mcp_request)
             
-            # Create process
-            process = await asyncio.create_subprocess_exec(
-                *full_command,
+        except Exception as e:
+            self.logger.error(f"Failed to execute MCP command: {e}")
+            raise
+    
+    async def _execute_persistent(self, command: str, args: List[str], mcp_request: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request over the shared MCP session and return its result."""
+        await self._ensure_session(command, args)
+        response = await self._request(mcp_request)
+        
+        if "result" in response:
+            return response["result"]
+        elif "error" in response:
+            raise Exception(f"Context7 error: {response['error']}")
+        raise Exception("No valid response from Context7")
+    
+    async def _ensure_session(self, command: str, args: List[str]) -> None:
+        """Start the MCP server process unless a live one already exists for this loop."""
+        loop = asyncio.get_running_loop()
+        key = (command, *args)
+        ready = self._session_ready
+        
+        if ready is not None and self._session_loop is loop and self._session_key == key:
+            if not ready.done():
+                # Another request is starting the session; share it
+                await ready
+                return
+            if not ready.exception() and self._reader_task is not None and not self._reader_task.done():
+                return
+        
+        # Missing, exited, or owned by another event loop: start a fresh one
+        self._discard_session()
+        ready = loop.create_future()
+        self._session_ready, self._session_loop, self._session_key = ready, loop, key
+        
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                command, *args,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                limit=_STREAM_LIMIT
             )
+            self._live_processes.append(self._proc)
+            self._pending = {}
+            self._stderr_tail = deque(maxlen=_STDERR_TAIL_LINES)
+            self._stderr_task = loop.create_task(self._read_stderr(self._proc, self._stderr_tail))
+            self._reader_task = loop.create_task(
+                self._read_responses(self._proc, self._pending, self._stderr_task, self._stderr_tail))
             
+            # MCP handshake
+            response = await self._request(_INITIALIZE_REQUEST)
+            if "error" in response:
+                raise _SessionError(f"initialize failed: {response['error']}")
+            self._write({"jsonrpc": "2.0", "method": "notifications/initialized"})
+            await self._proc.stdin.drain()
+        except Exception as e:
+            self._persistent_disabled = True
+            error = e if isinstance(e, _SessionError) else _SessionError(str(e))
+            ready.set_exception(error)
+            ready.exception()  # mark retrieved in case nobody else was waiting
+            self._discard_session()
+            raise error from e
+        
+        self.logger.info(f"Started persistent MCP session: {' '.join(key)}")
+        ready.set_result(None)
+    
+    def _write(self, message: Dict[str, Any]) -> None:
+        """Queue one JSON-RPC message on the session's stdin."""
+        self._proc.stdin.write((json.dumps(message) + "\n").encode())
+    
+    async def _request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a JSON-RPC request with a fresh id and wait for the matching response."""
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        
+        try:
+            self._write({**message, "id": request_id})
+            await self._proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            self._pending.pop(request_id, None)
+            raise _SessionError(f"MCP process closed its input: {e}") from e
+        
+        return await future
+    
+    async def _read_stderr(self, proc: asyncio.subprocess.Process, tail: Deque[str]) -> None:
+        """Log the session's stderr and keep its last lines for error reports."""
+        while True:
+            line = await proc.stderr.readline()
+            if not line:
+                break
+            text = line.decode(errors="replace").rstrip()
+            if text:
+                tail.append(text)
+                self.logger.debug(f"MCP server: {text}")
+    
+    async def _read_responses(self, proc: asyncio.subprocess.Process,
+                              pending: Dict[int, asyncio.Future],
+                              stderr_task: asyncio.Task, stderr_tail: Deque[str]) -> None:
+        """Route responses from the session's stdout to their waiting requests."""
+        reason = "MCP process exited"
+        try:
+            while True:
+                line = await proc.stdout.readline()
+                if not line:
+                    break
+                try:
+                    response = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                
+                if isinstance(response, dict):
+                    future = pending.pop(response.get("id"), None)
+                    if future is not None and not future.done():
+                        future.set_result(response)
+            
+            # Let the last stderr output arrive so it can explain the exit
+            try:
+                await asyncio.wait_for(asyncio.shield(stderr_task), timeout=1.0)
+            except Exception:
+                pass
+            if stderr_tail:
+                reason = f"{reason}: " + "\n".join(stderr_tail)
+        except Exception as e:
+            self.logger.warning(f"Stopped reading MCP session output: {e}")
+        finally:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(_SessionError(reason))
+            pending.clear()
+    
+    def _discard_session(self) -> None:
+        """Drop the current session, killing its process if it is still running."""
+        if self._proc is not None and self._proc.returncode is None:
+            try:
+                self._proc.kill()
+            except ProcessLookupError:
+                pass
+        if self._session_loop is not None and not self._session_loop.is_closed():
+            for task in (self._reader_task, self._stderr_task):
+                if task is not None:
+                    task.cancel()
+        self._live_processes.clear()
+        self._proc = None
+        self._reader_task = None
+        self._stderr_task = None
+    
+    async def close(self) -> None:
+        """Shut down the persistent MCP session, if one is running."""
+        proc = self._proc
+        self._discard_session()
+        self._session_ready = None
+        if proc is not None:
+            await proc.wait()
+    
+    async def _execute_once(self, command: str, args: List[str], mcp_request: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the MCP command as a one-off process for a single request."""
+        # Prepare the full command
+        full_command = [command] + args
+        
+        # Create process
+        process = await asyncio.create_subprocess_exec(
+            *full_command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=_STREAM_LIMIT
+        )
+        # Drain stderr alongside so a chatty process can't block on a full pipe
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        
+        try:
             # Send MCP request
             request_json = json.dumps(mcp_request) + "\n"
-            stdout, stderr = await process.communicate(input=request_json.encode())
+            process.stdin.write(request_json.encode())
+            await process.stdin.drain()
+            
+            # Stream responses and return on the first one answering our request,
+            # rather than waiting for the process to exit
+            request_id = mcp_request.get("id")
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    response = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(response, dict) or response.get("id") != request_id:
+                    continue
+                
+                if "result" in response:
+                    return response["result"]
+                elif "error" in response:
+                    raise Exception(f"Context7 error: {response['error']}")
             
+            await process.wait()
+            stderr = await stderr_task
             if process.returncode != 0:
                 raise Exception(f"Context7 command failed: {stderr.decode()}")
-            
-            # Parse response
-            response_lines = stdout.decode().strip().split('\n')
-            for line in response_lines:
-                if line.strip():
-                    try:
-                        response = json.loads(line)
-                        if "result" in response:
-                            return response["result"]
-                        elif "error" in response:
-                            raise Exception(f"Context7 error: {response['error']}")
-                    except json.JSONDecodeError:
-                        continue
-            
             raise Exception("No valid response from Context7")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to execute MCP command: {e}")
-            raise
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            if not stderr_task.done():
+                stderr_task.cancel()
     
     def create_resolve_request(self, library_name: str) -> Dict[str, Any]:
         """
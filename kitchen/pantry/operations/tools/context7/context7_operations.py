@@ -12,6 +12,25 @@ Created: 2025-07-08T11:15:00Z
 from typing import Dict, Any, Optional
 from .context7_client import Context7Client
 
+# Shared client so config, cache connection and rate-limit state persist across operations
+_client: Optional[Context7Client] = None
+
+
+def _get_client() -> Context7Client:
+    """
+    Return the shared Context7 client, creating it on first use.
+    
+    Construction has no await points, so operations running on one event loop
+    cannot race to create it.
+    
+    Returns:
+        The shared Context7Client instance
+    """
+    global _client
+    if _client is None:
+        _client = Context7Client()
+    return _client
+
 
 async def resolve_library_id_operation(library_name: str) -> Dict[str, Any]:
     """
@@ -23,7 +42,7 @@ async def resolve_library_id_operation(library_name: str) -> Dict[str, Any]:
     Returns:
         Dictionary with library ID and confidence score
     """
-    client = Context7Client()
+    client = _get_client()
     return await client.resolve_library_id(library_name)
 
 
@@ -39,7 +58,7 @@ async def get_library_docs_operation(library_id: str, topic: Optional[str] = Non
     Returns:
         Dictionary with documentation content and metadata
     """
-    client = Context7Client()
+    client = _get_client()
     return await client.get_library_docs(library_id, topic, tokens)
 
 
@@ -50,7 +69,7 @@ async def context7_health_check_operation() -> Dict[str, Any]:
     Returns:
         Dictionary with health status information
     """
-    client = Context7Client()
+    client = _get_client()
     return await client.health_check()
 
 
@@ -61,7 +80,7 @@ async def context7_cache_stats_operation() -> Dict[str, Any]:
     Returns:
         Dictionary with cache statistics
     """
-    client = Context7Client()
+    client = _get_client()
     return client.cache.get_cache_stats()
 
 
@@ -72,7 +91,7 @@ async def context7_rate_limit_stats_operation() -> Dict[str, Any]:
     Returns:
         Dictionary with rate limit usage statistics
     """
-    client = Context7Client()
+    client = _get_client()
     return client.rate_limiter.get_current_usage()
 
 
@@ -83,7 +102,7 @@ async def clear_context7_cache_operation() -> Dict[str, Any]:
     Returns:
         Dictionary with operation result
     """
-    client = Context7Client()
+    client = _get_client()
     client.cache.clear()
     return {
         "status": "success",
@@ -99,7 +118,7 @@ async def reset_context7_rate_limiter_operation() -> Dict[str, Any]:
     Returns:
         Dictionary with operation result
     """
-    client = Context7Client()
+    client = _get_client()
     client.rate_limiter.reset()
     return {
         "status": "success",
@@ -9,8 +9,14 @@ Version: 1.0.0
 Created: 2025-07-08T11:15:00Z
 """
 
+import asyncio
 import time
-from typing import List
+from collections import deque
+from typing import Deque
+
+# Sliding window for requests_per_minute, and the shorter window burst_limit applies to
+_WINDOW_SECONDS = 60.0
+_BURST_WINDOW_SECONDS = 1.0
 
 
 class RateLimiter:
@@ -22,11 +28,57 @@ class RateLimiter:
         
         Args:
             requests_per_minute: Maximum requests allowed per minute
-            burst_limit: Maximum burst requests allowed
+            burst_limit: Maximum requests allowed within one second
         """
         self.requests_per_minute = requests_per_minute
         self.burst_limit = burst_limit
-        self.requests: List[float] = []
+        # Monotonic timestamps of admitted requests, oldest first
+        self.requests: Deque[float] = deque()
+    
+    def _expire(self, now: float) -> None:
+        """Drop requests that have left the one-minute window."""
+        requests = self.requests
+        while requests and now - requests[0] >= _WINDOW_SECONDS:
+            requests.popleft()
+    
+    def _burst_count(self, now: float) -> int:
+        """Count requests inside the burst window, scanning back from the newest."""
+        count = 0
+        for req_time in reversed(self.requests):
+            if now - req_time >= _BURST_WINDOW_SECONDS or count >= self.burst_limit:
+                break
+            count += 1
+        return count
+    
+    def _has_capacity(self, now: float) -> bool:
+        """Check both the per-minute and burst limits."""
+        return (len(self.requests) < self.requests_per_minute and
+                self._burst_count(now) < self.burst_limit)
+    
+    def _wait_time(self, now: float) -> float:
+        """Seconds until a request would be admitted, 0 if it can proceed now."""
+        wait = 0.0
+        if len(self.requests) >= self.requests_per_minute:
+            wait = _WINDOW_SECONDS - (now - self.requests[0])
+        if self._burst_count(now) >= self.burst_limit:
+            wait = max(wait, _BURST_WINDOW_SECONDS - (now - self.requests[-self.burst_limit]))
+        return max(wait, 0.0)
+    
+    async def acquire(self) -> None:
+        """
+        Wait until a request can proceed, then record it.
+        
+        Sleeps until the oldest blocking request leaves its window rather than
+        failing, so callers don't need their own retry loop.
+        """
+        while True:
+            now = time.monotonic()
+            self._expire(now)
+            wait = self._wait_time(now)
+            if wait <= 0:
+                self.requests.append(now)
+                return
+            await asyncio.sleep(wait + 1e-3)
     
     def can_proceed(self) -> bool:
         """
@@ -35,13 +87,11 @@ class RateLimiter:
         Returns:
             True if request can proceed, False otherwise
         """
-        now = time.time()
-        
-        # Remove old requests (older than 1 minute)
-        self.requests = [req_time for req_time in self.requests if now - req_time < 60]
+        now = time.monotonic()
+        self._expire(now)
         
         # Check if we're within limits
-        if len(self.requests) < self.burst_limit:
+        if self._has_capacity(now):
             self.requests.append(now)
             return True
         
@@ -54,14 +104,14 @@ class RateLimiter:
         Returns:
             Dictionary with usage statistics
         """
-        now = time.time()
-        recent_requests = [req_time for req_time in self.requests if now - req_time < 60]
+        now = time.monotonic()
+        self._expire(now)
         
         return {
-            "current_requests": len(recent_requests),
+            "current_requests": len(self.requests),
             "burst_limit": self.burst_limit,
             "requests_per_minute": self.requests_per_minute,
-            "can_proceed": len(recent_requests) < self.burst_limit
+            "can_proceed": self._has_capacity(now)
         }
     
     def reset(self) -> None:
@@ -13,20 +13,28 @@ logger = logging.getLogger(__name__)
 class DataAnalysisTask:
     """Data analysis task operations"""
     
+    # Invariant parts of the simulated response, shared across calls
+    _TEMPLATE = {
+        'success': True,
+        'operation': 'analyze_dataset'
+    }
+    _RESULTS_TEMPLATE = {
+        'sample_size': 1000,
+        'mean': 42.5,
+        'std_dev': 12.3
+    }
+    
     def analyze_dataset(self, dataset_path: str, analysis_type: str) -> Dict[str, Any]:
         """Analyze a dataset according to specified analysis type"""
         try:
             # Here you would implement real data analysis logic
             # For now, simulate the task with a structured response
             return {
-                'success': True,
-                'operation': 'analyze_dataset',
+                **self._TEMPLATE,
                 'dataset_path': dataset_path,
                 'analysis_type': analysis_type,
                 'analysis_results': {
-                    'sample_size': 1000,
-                    'mean': 42.5,
-                    'std_dev': 12.3,
+                    **self._RESULTS_TEMPLATE,
                     'insights': f"Analysis of {dataset_path} using {analysis_type}"
                 },
                 'timestamp': datetime.now().isoformat()
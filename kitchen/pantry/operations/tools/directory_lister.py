@@ -4,8 +4,9 @@ Directory Lister Module
 Single-purpose module for listing directory contents with actual functionality.
 """
 
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional
 from datetime import datetime
 import logging
 
@@ -14,47 +15,120 @@ logger = logging.getLogger(__name__)
 class DirectoryLister:
     """Real directory listing operations"""
     
-    def list_directory(self, directory_path: str, include_hidden: bool = False) -> Dict[str, Any]:
-        """Actually list directory contents"""
+    def iter_directory(self, directory_path: str, include_hidden: bool = False,
+                       limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield an info dict per directory entry as the directory is scanned.
+        
+        Stops after `limit` entries when given. Raises FileNotFoundError or
+        NotADirectoryError (on first iteration) for a bad path.
+        """
+        if limit is not None and limit <= 0:
+            return
+        
+        with os.scandir(directory_path) as entries:
+            yield from self._entry_infos(entries, include_hidden, limit)
+    
+    def _entry_infos(self, entries, include_hidden: bool,
+                     limit: Optional[int]) -> Iterator[Dict[str, Any]]:
+        """
+        Build info dicts from an open scandir iterator.
+        
+        Dangling symlinks are described by the link itself; entries removed while
+        the directory is being read are skipped.
+        """
+        yielded = 0
+        # scandir yields cached entry types, so each entry costs at most one stat
+        for entry in entries:
+            # Skip hidden files if not requested
+            if not include_hidden and entry.name[0] == '.':
+                continue
+            
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+            
+            yield {
+                'name': entry.name,
+                'path': entry.path,
+                'size': stat.st_size,
+                'modified_time': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                'is_file': entry.is_file(),
+                'is_dir': entry.is_dir()
+            }
+            
+            yielded += 1
+            if yielded == limit:
+                return
+    
+    def list_directory(self, directory_path: str, include_hidden: bool = False,
+                       detail: bool = True, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Actually list directory contents.
+        
+        With detail=False only the file and directory counts are returned, skipping
+        the per-entry stat and dict construction. With a limit, scanning stops after
+        that many entries and the totals cover only the listed entries.
+        """
         try:
             directory = Path(directory_path)
             
-            if not directory.exists():
+            files = []
+            directories = []
+            total_files = 0
+            total_directories = 0
+            
+            # Only opening the directory can mean the directory itself is missing
+            try:
+                entries = os.scandir(directory)
+            except FileNotFoundError:
                 return {
                     'success': False,
                     'error': f'Directory not found: {directory}',
                     'operation': 'list_directory'
                 }
-            
-            if not directory.is_dir():
+            except NotADirectoryError:
                 return {
                     'success': False,
                     'error': f'Path is not a directory: {directory}',
                     'operation': 'list_directory'
                 }
             
-            files = []
-            directories = []
+            with entries:
+                if detail:
+                    if limit is None or limit > 0:
+                        for item_info in self._entry_infos(entries, include_hidden, limit):
+                            if item_info['is_file']:
+                                files.append(item_info)
+                            else:
+                                directories.append(item_info)
+                    total_files = len(files)
+                    total_directories = len(directories)
+                else:
+                    for entry in entries:
+                        if not include_hidden and entry.name[0] == '.':
+                            continue
+                        if limit is not None and total_files + total_directories >= limit:
+                            break
+                        if entry.is_file():
+                            total_files += 1
+                        else:
+                            total_directories += 1
             
-            for item in directory.iterdir():
-                # Skip hidden files if not requested
-                if not include_hidden and item.name.startswith('.'):
-                    continue
-                
-                stat = item.stat()
-                item_info = {
-                    'name': item.name,
-                    'path': str(item),
-                    'size': stat.st_size,
-                    'modified_time': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    'is_file': item.is_file(),
-                    'is_dir': item.is_dir()
+            if not detail:
+                return {
+                    'success': True,
+                    'operation': 'list_directory',
+                    'directory_path': str(directory),
+                    'total_files': total_files,
+                    'total_directories': total_directories,
+                    'include_hidden': include_hidden,
+                    'timestamp': datetime.now().isoformat()
                 }
-                
-                if item.is_file():
-                    files.append(item_info)
-                else:
-                    directories.append(item_info)
             
             return {
                 'success': True,
@@ -62,8 +136,8 @@ class DirectoryLister:
                 'directory_path': str(directory),
                 'files': files,
                 'directories': directories,
-                'total_files': len(files),
-                'total_directories': len(directories),
+                'total_files': total_files,
+                'total_directories': total_directories,
                 'include_hidden': include_hidden,
                 'timestamp': datetime.now().isoformat()
             }
@@ -75,4 +149,4 @@ class DirectoryLister:
                 'error': str(e),
                 'operation': 'list_directory',
                 'directory_path': directory_path
-            } 
\ No newline at end of file
+            }
\ No newline at end of file
@@ -4,14 +4,94 @@ File Checker Module
 Single-purpose module for checking file existence and getting file information.
 """
 
+import os
+import stat as stat_module
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional
 from datetime import datetime
+import time
 import hashlib
+import mmap
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+def _try_stat(path, follow_symlinks: bool = True) -> Optional[os.stat_result]:
+    """Stat a path in one syscall, returning None if it does not exist"""
+    try:
+        return os.stat(path, follow_symlinks=follow_symlinks)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+# Files are hashed through a fixed buffer so memory stays flat regardless of file size
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Files at least this large are hashed straight from a memory map of the page cache
+_MMAP_MIN_SIZE = 4 << 20
+_MMAP_UPDATE_SIZE = 1 << 24
+
+def _hash_mapped(f, algorithm: str) -> Optional[str]:
+    """Hash an open file through mmap, or return None if it cannot be mapped"""
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    with mm:
+        if hasattr(mm, 'madvise'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        digest = hashlib.new(algorithm)
+        # Bounded slices keep each update under hashlib's size limits on very large files
+        with memoryview(mm) as view:
+            for offset in range(0, len(mm), _MMAP_UPDATE_SIZE):
+                digest.update(view[offset:offset + _MMAP_UPDATE_SIZE])
+        return digest.hexdigest()
+
+def _hash_file(path: Path, algorithm: str, size: int = 0) -> str:
+    """
+    Hash a file without loading it into memory.
+    
+    BLAKE3 hashes a memory map of the file on all cores when the blake3 package is
+    installed. hashlib algorithms hash large files from a memory map, and smaller
+    ones through hashlib.file_digest where available (Python 3.11+), otherwise
+    through a chunked readinto loop.
+    """
+    if algorithm == 'blake3':
+        return blake3(max_threads=blake3.AUTO).update_mmap(path).hexdigest()
+    
+    with open(path, 'rb', buffering=0) as f:
+        if size >= _MMAP_MIN_SIZE:
+            file_hash = _hash_mapped(f, algorithm)
+            if file_hash is not None:
+                return file_hash
+        
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, algorithm).hexdigest()
+        
+        digest = hashlib.new(algorithm)
+        buf = bytearray(_HASH_CHUNK_SIZE)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            digest.update(view[:n])
+        return digest.hexdigest()
+
+@dataclass(frozen=True)
+class FileInfo:
+    """Compact per-file record for bulk scans, much smaller than a result dict"""
+    __slots__ = ('path', 'size', 'mtime', 'mode', 'hash')
+    path: str
+    size: int
+    mtime: float
+    mode: int
+    hash: Optional[str]
+
 class FileChecker:
     """Real file checking operations"""
     
@@ -19,10 +99,9 @@ class FileChecker:
         """Actually check if a file exists"""
         try:
             path = Path(file_path)
-            exists = path.exists()
+            stat = _try_stat(path)
             
-            if exists:
-                stat = path.stat()
+            if stat is not None:
                 return {
                     'success': True,
                     'operation': 'file_exists',
@@ -30,7 +109,7 @@ class FileChecker:
                     'exists': True,
                     'file_size': stat.st_size,
                     'modified_time': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
                 }
             else:
                 return {
@@ -38,7 +117,7 @@ class FileChecker:
                     'operation': 'file_exists',
                     'file_path': str(path),
                     'exists': False,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
                 }
                 
         except Exception as e:
@@ -50,45 +129,107 @@ class FileChecker:
                 'file_path': file_path
             }
     
-    def get_file_info(self, file_path: str) -> Dict[str, Any]:
-        """Actually get detailed file information"""
+    def hash_file(self, file_path: str, algorithm: str = 'md5') -> Dict[str, Any]:
+        """
+        Actually hash a file
+        
+        Args:
+            file_path: File to hash
+            algorithm: 'blake3' or any hashlib algorithm name; 'blake3' falls back
+                to MD5 when the blake3 package is not installed
+        """
+        if algorithm == 'blake3' and not BLAKE3_AVAILABLE:
+            algorithm = 'md5'
+        
         try:
             path = Path(file_path)
+            stat = _try_stat(path)
             
-            if not path.exists():
+            if stat is None:
                 return {
                     'success': False,
                     'error': f'File not found: {path}',
-                    'operation': 'get_file_info'
+                    'operation': 'hash_file'
                 }
             
-            stat = path.stat()
-            
-            # Calculate file hash for verification
-            try:
-                with open(path, 'rb') as f:
-                    file_hash = hashlib.md5(f.read()).hexdigest()
-            except Exception:
-                file_hash = None
+            return {
+                'success': True,
+                'operation': 'hash_file',
+                'file_path': str(path),
+                'file_size': stat.st_size,
+                'file_hash': _hash_file(path, algorithm, stat.st_size),
+                'hash_algorithm': algorithm,
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+            }
             
+        except Exception as e:
+            logger.error(f"Error hashing file {file_path}: {str(e)}")
             return {
+                'success': False,
+                'error': str(e),
+                'operation': 'hash_file',
+                'file_path': file_path
+            }
+    
+    def get_file_info(self, file_path: str, algorithm: str = 'md5',
+                      include_hash: bool = False) -> Dict[str, Any]:
+        """
+        Actually get detailed file information
+        
+        Hashing reads the whole file, so it is opt-in; without include_hash this is
+        a metadata-only call and the result has no file_hash/hash_algorithm keys.
+        
+        Args:
+            file_path: File to inspect
+            algorithm: 'blake3' or any hashlib algorithm name; 'blake3' falls back
+                to MD5 when the blake3 package is not installed
+            include_hash: Also hash the file contents
+        """
+        if algorithm == 'blake3' and not BLAKE3_AVAILABLE:
+            algorithm = 'md5'
+        
+        try:
+            path = Path(file_path)
+            # lstat first so the symlink check needs no extra syscall; only links are stat'ed again
+            stat = _try_stat(path, follow_symlinks=False)
+            is_symlink = stat is not None and stat_module.S_ISLNK(stat.st_mode)
+            if is_symlink:
+                stat = _try_stat(path)
+            
+            if stat is None:
+                return {
+                    'success': False,
+                    'error': f'File not found: {path}',
+                    'operation': 'get_file_info'
+                }
+            
+            info = {
                 'success': True,
                 'operation': 'get_file_info',
                 'file_path': str(path),
                 'file_name': path.name,
                 'file_extension': path.suffix,
                 'file_size': stat.st_size,
-                'file_hash': file_hash,
                 'created_time': datetime.fromtimestamp(stat.st_ctime).isoformat(),
                 'modified_time': datetime.fromtimestamp(stat.st_mtime).isoformat(),
                 'accessed_time': datetime.fromtimestamp(stat.st_atime).isoformat(),
-                'is_file': path.is_file(),
-                'is_dir': path.is_dir(),
-                'is_symlink': path.is_symlink(),
+                'is_file': stat_module.S_ISREG(stat.st_mode),
+                'is_dir': stat_module.S_ISDIR(stat.st_mode),
+                'is_symlink': is_symlink,
                 'permissions': oct(stat.st_mode)[-3:],
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
             }
             
+            if include_hash:
+                # Calculate file hash for verification
+                try:
+                    info['file_hash'] = _hash_file(path, algorithm, stat.st_size)
+                except Exception:
+                    info['file_hash'] = None
+                info['hash_algorithm'] = algorithm
+            
+            return info
+            
         except Exception as e:
             logger.error(f"Error getting file info {file_path}: {str(e)}")
             return {
@@ -96,4 +237,63 @@ class FileChecker:
                 'error': str(e),
                 'operation': 'get_file_info',
                 'file_path': file_path
-            } 
\ No newline at end of file
+            }
+    
+    def get_file_info_many(self, file_paths: Iterable[str], max_workers: Optional[int] = None,
+                           algorithm: str = 'md5', include_hash: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get file information for many files concurrently.
+        
+        File reads and hashlib digests release the GIL, so a thread pool overlaps
+        disk I/O and hashing across files. Results are returned in input order.
+        """
+        file_paths = list(file_paths)
+        if not file_paths:
+            return []
+        
+        workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=min(workers, len(file_paths))) as executor:
+            return list(executor.map(lambda path: self.get_file_info(path, algorithm, include_hash),
+                                     file_paths))
+    
+    def _stat_one(self, file_path: str, algorithm: str, include_hash: bool) -> Optional[FileInfo]:
+        """Build a FileInfo, or None if the file is missing or unreadable"""
+        stat = _try_stat(file_path)
+        if stat is None:
+            return None
+        
+        file_hash = None
+        if include_hash:
+            try:
+                file_hash = _hash_file(file_path, algorithm, stat.st_size)
+            except OSError:
+                pass
+        return FileInfo(str(file_path), stat.st_size, stat.st_mtime, stat.st_mode, file_hash)
+    
+    def stat_files(self, file_paths: Iterable[str], include_hash: bool = False, algorithm: str = 'md5',
+                   max_workers: Optional[int] = None) -> List[Optional[FileInfo]]:
+        """
+        Collect raw metadata for many files as FileInfo records.
+        
+        Intended for bulk scans where building a result dict per file would
+        dominate; times and modes are left unformatted.
+        
+        Args:
+            file_paths: Files to inspect
+            include_hash: Also hash each file (on a thread pool)
+            algorithm: Hash algorithm, as for get_file_info
+            max_workers: Thread pool size when hashing
+            
+        Returns:
+            One FileInfo per path in input order, None where the path does not exist
+        """
+        if algorithm == 'blake3' and not BLAKE3_AVAILABLE:
+            algorithm = 'md5'
+        
+        file_paths = list(file_paths)
+        if not include_hash or len(file_paths) <= 1:
+            return [self._stat_one(path, algorithm, include_hash) for path in file_paths]
+        
+        workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=min(workers, len(file_paths))) as executor:
+            return list(executor.map(lambda path: self._stat_one(path, algorithm, include_hash), file_paths))
\ No newline at end of file
@@ -4,11 +4,15 @@ File Deleter Module
 Single-purpose module for deleting files with actual functionality.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
-from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional
+import time
 import logging
 
+from .file_checker import _try_stat
+
 logger = logging.getLogger(__name__)
 
 class FileDeleter:
@@ -18,15 +22,16 @@ class FileDeleter:
         """Actually delete a file"""
         try:
             path = Path(file_path)
+            stat = _try_stat(path)
             
-            if not path.exists():
+            if stat is None:
                 if force:
                     return {
                         'success': True,
                         'operation': 'delete_file',
                         'file_path': str(path),
                         'message': 'File does not exist (force=True)',
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
                     }
                 else:
                     return {
@@ -35,8 +40,8 @@ class FileDeleter:
                         'operation': 'delete_file'
                     }
             
-            # Get file info before deletion
-            file_size = path.stat().st_size
+            # Size comes from the stat taken above
+            file_size = stat.st_size
             
             # Delete the file
             path.unlink()
@@ -46,7 +51,7 @@ class FileDeleter:
                 'operation': 'delete_file',
                 'file_path': str(path),
                 'deleted_size': file_size,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
             }
             
         except Exception as e:
@@ -56,4 +61,20 @@ class FileDeleter:
                 'error': str(e),
                 'operation': 'delete_file',
                 'file_path': file_path
-            } 
\ No newline at end of file
+            }
+    
+    def delete_files(self, file_paths: Iterable[str], force: bool = False,
+                     max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Delete many files concurrently.
+        
+        unlink is latency-bound on the filesystem journal, so a thread pool keeps
+        several deletions in flight. Results are returned in input order.
+        """
+        file_paths = list(file_paths)
+        if not file_paths:
+            return []
+        
+        workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=min(workers, len(file_paths))) as executor:
+            return list(executor.map(lambda path: self.delete_file(path, force), file_paths))
\ No newline at end of file
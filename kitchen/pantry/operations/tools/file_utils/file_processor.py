@@ -4,28 +4,120 @@ File Processor Task
 Single-purpose module for file processing tasks.
 """
 
-from typing import Dict, Any
-from datetime import datetime
+import fnmatch
+import os
+import re
+import time
+from typing import Dict, Any, Iterator, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+_MAGIC_CHARS = re.compile(r'[*?[]')
+
+def _compile_pattern(file_pattern: str) -> Tuple[str, List[Any]]:
+    """
+    Split a glob into its literal root directory and per-component matchers.
+    
+    Each matcher is either the string '**' or a (regex, allow_hidden) pair, so
+    name matching in the walk never re-translates the pattern.
+    """
+    parts = file_pattern.replace(os.sep, '/').split('/')
+    root_parts = []
+    while len(parts) > 1 and not _MAGIC_CHARS.search(parts[0]):
+        root_parts.append(parts.pop(0))
+    
+    root = '/'.join(root_parts) if root_parts else '.'
+    if root_parts == ['']:
+        root = '/'
+    
+    matchers: List[Any] = []
+    for part in parts:
+        if part == '**':
+            if not matchers or matchers[-1] != '**':
+                matchers.append('**')
+        else:
+            # As with glob, hidden entries only match components that start with a dot
+            matchers.append((re.compile(fnmatch.translate(part)), part.startswith('.')))
+    return root, matchers
+
+def _iter_matches(directory: str, matchers: List[Any], index: int = 0) -> Iterator[str]:
+    """
+    Walk a directory tree with os.scandir, yielding files that match the matchers.
+    
+    Entry types come from the directory listing itself, so no per-entry stat is
+    needed. '**' matches zero or more directories and does not follow symlinks;
+    a trailing '**' matches every file below the directory.
+    """
+    matcher = matchers[index]
+    last = index == len(matchers) - 1
+    
+    if matcher == '**':
+        if not last:
+            yield from _iter_matches(directory, matchers, index + 1)
+        try:
+            with os.scandir(directory) as entries:
+                visible = [entry for entry in entries if not entry.name.startswith('.')]
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            return
+        for entry in visible:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_matches(entry.path, matchers, index)
+            elif last and entry.is_file():
+                yield entry.path
+        return
+    
+    regex, allow_hidden = matcher
+    try:
+        with os.scandir(directory) as entries:
+            matched = [entry for entry in entries
+                       if regex.match(entry.name) and (allow_hidden or not entry.name.startswith('.'))]
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return
+    
+    for entry in matched:
+        if last:
+            if entry.is_file():
+                yield entry.path
+        elif entry.is_dir():
+            yield from _iter_matches(entry.path, matchers, index + 1)
+
+def find_files(file_pattern: str) -> List[str]:
+    """
+    Expand a glob pattern ('*', '?', '[...]' and '**') into matching file paths.
+    
+    Args:
+        file_pattern: Pattern such as 'data/**/*.csv'
+    
+    Returns:
+        Sorted list of matching file paths
+    """
+    root, matchers = _compile_pattern(file_pattern)
+    if root == '.':
+        # Report paths relative to the working directory like glob does
+        return sorted(path[2:] if path.startswith('./') else path
+                      for path in set(_iter_matches(root, matchers)))
+    return sorted(set(_iter_matches(root, matchers)))
+
 class FileProcessorTask:
     """File processing task operations"""
     
     def process_files(self, file_pattern: str, operation: str) -> Dict[str, Any]:
         """Process files according to specified operation"""
         try:
-            # Here you would implement real file processing logic
-            # For now, simulate the task with a structured response
+            started = time.perf_counter()
+            files = find_files(file_pattern)
+            
+            # Here you would implement real per-file processing for the operation
             return {
                 'success': True,
                 'operation': 'process_files',
                 'file_pattern': file_pattern,
                 'processing_operation': operation,
-                'files_processed': 5,
-                'processing_time': "2 minutes",
-                'timestamp': datetime.now().isoformat()
+                'files': files,
+                'files_processed': len(files),
+                'processing_time': f"{time.perf_counter() - started:.3f} seconds",
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
             }
         except Exception as e:
             logger.error(f"Error processing files: {str(e)}")
@@ -33,4 +125,4 @@ class FileProcessorTask:
                 'success': False,
                 'error': str(e),
                 'operation': 'process_files'
-            } 
\ No newline at end of file
+            }
@@ -8,17 +8,20 @@ Handles both text and binary file reading operations.
 import hashlib
 from pathlib import Path
 from typing import Dict, Any
-from datetime import datetime
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Binary files are hashed through a fixed buffer instead of being loaded whole
+_HASH_CHUNK_SIZE = 1 << 20
+
 class FileReader:
     """Real file reading operations"""
     
     def __init__(self):
-        self.supported_text_formats = ['.txt', '.json', '.yaml', '.yml', '.md', '.csv', '.xml', '.html']
-        self.supported_binary_formats = ['.jpg', '.jpeg', '.png', '.gif', '.pdf', '.zip', '.exe', '.dll']
+        self.supported_text_formats = frozenset({'.txt', '.json', '.yaml', '.yml', '.md', '.csv', '.xml', '.html'})
+        self.supported_binary_formats = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.pdf', '.zip', '.exe', '.dll'})
     
     def read_file(self, file_path: str, encoding: str = 'utf-8') -> Dict[str, Any]:
         """Actually read a file and return its contents"""
@@ -31,21 +34,30 @@ class FileReader:
                     'operation': 'read_file'
                 }
             
-            # Determine if file is binary or text
-            is_binary = file_path.suffix.lower() in self.supported_binary_formats
+            # Determine if file is binary or text; the extension is sliced from the name
+            # directly (a leading dot alone is not a suffix, as with Path.suffix)
+            name = file_path.name
+            dot = name.rfind('.')
+            is_binary = dot > 0 and name[dot:].lower() in self.supported_binary_formats
             
             if is_binary:
-                with open(file_path, 'rb') as f:
-                    content = f.read()
-                file_hash = hashlib.md5(content).hexdigest()
+                digest = hashlib.md5()
+                file_size = 0
+                buf = bytearray(_HASH_CHUNK_SIZE)
+                view = memoryview(buf)
+                with open(file_path, 'rb', buffering=0) as f:
+                    while n := f.readinto(buf):
+                        digest.update(view[:n])
+                        file_size += n
+                file_hash = digest.hexdigest()
                 return {
                     'success': True,
                     'operation': 'read_file',
                     'file_path': str(file_path),
                     'content_type': 'binary',
-                    'file_size': len(content),
+                    'file_size': file_size,
                     'file_hash': file_hash,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
                 }
             else:
                 with open(file_path, 'r', encoding=encoding) as f:
@@ -58,7 +70,7 @@ class FileReader:
                     'content_type': 'text',
                     'file_size': len(content),
                     'encoding': encoding,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
                 }
                 
         except Exception as e:
@@ -5,9 +5,10 @@ Single-purpose module for writing files with actual functionality.
 Handles both text and binary file writing operations.
 """
 
+import os
 from pathlib import Path
 from typing import Dict, Any, Union
-from datetime import datetime
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,46 +22,45 @@ class FileWriter:
         try:
             file_path = Path(file_path)
             
-            # Check if file exists and overwrite setting
-            if file_path.exists() and not overwrite:
-                return {
-                    'success': False,
-                    'error': f'File already exists and overwrite=False: {file_path}',
-                    'operation': 'write_file'
-                }
-            
             # Create directory if it doesn't exist
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Determine if content is binary or text
-            if isinstance(content, bytes):
-                with open(file_path, 'wb') as f:
-                    f.write(content)
-                content_type = 'binary'
-            else:
-                with open(file_path, 'w', encoding=encoding) as f:
-                    f.write(content)
-                content_type = 'text'
-            
-            # Verify file was written
-            if file_path.exists():
-                file_size = file_path.stat().st_size
-                return {
-                    'success': True,
-                    'operation': 'write_file',
-                    'file_path': str(file_path),
-                    'content_type': content_type,
-                    'file_size': file_size,
-                    'encoding': encoding if content_type == 'text' else None,
-                    'timestamp': datetime.now().isoformat()
-                }
-            else:
+            # O_EXCL / 'x' mode refuse an existing file atomically, with no separate exists() check
+            try:
+                # Determine if content is binary or text
+                if isinstance(content, (bytes, bytearray)):
+                    flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if overwrite else os.O_EXCL)
+                    fd = os.open(file_path, flags, 0o666)
+                    try:
+                        view = memoryview(content)
+                        while view:
+                            view = view[os.write(fd, view):]
+                    finally:
+                        os.close(fd)
+                    file_size = len(content)
+                    content_type = 'binary'
+                else:
+                    with open(file_path, 'w' if overwrite else 'x', encoding=encoding) as f:
+                        f.write(content)
+                        f.flush()
+                        file_size = os.fstat(f.fileno()).st_size
+                    content_type = 'text'
+            except FileExistsError:
                 return {
                     'success': False,
-                    'error': 'File was not created successfully',
-                    'operation': 'write_file',
-                    'file_path': str(file_path)
+                    'error': f'File already exists and overwrite=False: {file_path}',
+                    'operation': 'write_file'
                 }
+            
+            return {
+                'success': True,
+                'operation': 'write_file',
+                'file_path': str(file_path),
+                'content_type': content_type,
+                'file_size': file_size,
+                'encoding': encoding if content_type == 'text' else None,
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+            }
                 
         except Exception as e:
             logger.error(f"Error writing file {file_path}: {str(e)}")
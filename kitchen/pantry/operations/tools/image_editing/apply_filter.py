@@ -5,17 +5,22 @@ Single-purpose module for applying a filter to an image.
 """
 
 from PIL import Image, ImageFilter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
-from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional
+import os
+import time
 import logging
 
+from .resize_image import _save_options
+
 logger = logging.getLogger(__name__)
 
 class ImageFilterer:
     """Apply filter to image operation"""
     
-    def apply_filter(self, image_path: str, filter_name: str, output_path: str) -> Dict[str, Any]:
+    def apply_filter(self, image_path: str, filter_name: str, output_path: str,
+                     quality: Optional[int] = None, fast_encode: bool = True) -> Dict[str, Any]:
         try:
             image_path = Path(image_path)
             output_path = Path(output_path)
@@ -41,14 +46,14 @@ class ImageFilterer:
                     }
                 filtered = img.filter(filter_map[filter_name])
                 output_path.parent.mkdir(parents=True, exist_ok=True)
-                filtered.save(output_path)
+                filtered.save(output_path, **_save_options(output_path, quality, fast_encode))
             return {
                 'success': True,
                 'operation': 'apply_filter',
                 'input_path': str(image_path),
                 'output_path': str(output_path),
                 'filter': filter_name,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
             }
         except Exception as e:
             logger.error(f"Error applying filter to image {image_path}: {str(e)}")
@@ -58,4 +63,32 @@ class ImageFilterer:
                 'operation': 'apply_filter',
                 'input_path': str(image_path),
                 'output_path': str(output_path)
-            } 
\ No newline at end of file
+            }
+    
+    def apply_filter_many(self, items: Iterable[Dict[str, Any]],
+                          max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Apply filters to many images across worker processes.
+        
+        Filtering is CPU-bound and holds the GIL, so images are spread over a
+        process pool instead of threads.
+        
+        Args:
+            items: Dicts of apply_filter arguments (image_path, filter_name, output_path,
+                optionally quality and fast_encode)
+            max_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            One apply_filter result per item, in input order
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [self.apply_filter(**item) for item in items]
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(items))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_apply_filter_one, items, chunksize=4))
+
+def _apply_filter_one(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Process pool entry point; module level so it can be pickled"""
+    return ImageFilterer().apply_filter(**item)
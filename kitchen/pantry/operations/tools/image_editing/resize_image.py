@@ -4,18 +4,100 @@ Image Resize Operation
 Single-purpose module for resizing images.
 """
 
-from PIL import Image
+from PIL import ExifTags, Image, ImageOps
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
-from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional
+import os
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+# EXIF orientations that rotate by 90 degrees, swapping width and height
+_TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+try:
+    import pyvips
+    PYVIPS_AVAILABLE = True
+except (ImportError, OSError):
+    # OSError covers pyvips installed without the libvips shared library
+    PYVIPS_AVAILABLE = False
+
+def _save_options(output_path: Path, quality: Optional[int], fast_encode: bool) -> Dict[str, Any]:
+    """
+    Pillow save() options for the output format.
+    
+    fast_encode trades output size for encode speed: PNG deflates at level 1
+    instead of 6 and WebP uses its fastest method. JPEG keeps single-pass,
+    non-progressive encoding with default Huffman tables.
+    """
+    suffix = output_path.suffix.lower()
+    options: Dict[str, Any] = {}
+    if suffix == '.png':
+        if fast_encode:
+            options['compress_level'] = 1
+    elif suffix in ('.jpg', '.jpeg'):
+        options.update(optimize=False, progressive=False)
+        if quality is not None:
+            options['quality'] = quality
+    elif suffix == '.webp':
+        if fast_encode:
+            options['method'] = 0
+        if quality is not None:
+            options['quality'] = quality
+    return options
+
+def _vips_save_options(output_path: Path, quality: Optional[int], fast_encode: bool) -> Dict[str, Any]:
+    """libvips saver options matching _save_options"""
+    suffix = output_path.suffix.lower()
+    options: Dict[str, Any] = {}
+    if suffix == '.png' and fast_encode:
+        options['compression'] = 1
+    elif suffix in ('.jpg', '.jpeg', '.webp') and quality is not None:
+        options['Q'] = quality
+    return options
+
 class ImageResizer:
     """Resize image operation"""
     
-    def resize(self, image_path: str, width: int, height: int, output_path: str) -> Dict[str, Any]:
+    def _resize_vips(self, image_path: Path, width: int, height: int, output_path: Path,
+                     save_options: Dict[str, Any]) -> bool:
+        """
+        Resize with libvips, returning False if libvips cannot handle the image.
+        
+        thumbnail shrinks JPEGs during decode and streams the rest of the pipeline,
+        so the full-size image is never held in memory.
+        """
+        try:
+            thumbnail = pyvips.Image.thumbnail(str(image_path), width, height=height, size='force')
+            thumbnail.write_to_file(str(output_path), **save_options)
+            return True
+        except pyvips.Error as e:
+            logger.debug(f"libvips could not resize {image_path}, using Pillow: {e}")
+            return False
+    
+    def _resize_pillow(self, image_path: Path, width: int, height: int, output_path: Path,
+                       save_options: Dict[str, Any]) -> None:
+        """
+        Resize with Pillow, box-reducing large downsamples before the Lanczos pass.
+        
+        JPEGs are drafted so libjpeg decodes at the smallest 1/2, 1/4 or 1/8 scale
+        that still leaves twice the target size, and the EXIF orientation is applied
+        before resizing, as libvips' thumbnail does.
+        """
+        with Image.open(image_path) as img:
+            # The draft box is in stored orientation, so swap it for rotated images
+            if img.getexif().get(ExifTags.Base.Orientation) in _TRANSPOSED_ORIENTATIONS:
+                img.draft(None, (height * 2, width * 2))
+            else:
+                img.draft(None, (width * 2, height * 2))
+            ImageOps.exif_transpose(img, in_place=True)
+            resized = img.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+            resized.save(output_path, **save_options)
+    
+    def resize(self, image_path: str, width: int, height: int, output_path: str,
+               quality: Optional[int] = None, fast_encode: bool = True) -> Dict[str, Any]:
         try:
             image_path = Path(image_path)
             output_path = Path(output_path)
@@ -25,17 +107,19 @@ class ImageResizer:
                     'error': f'Image not found: {image_path}',
                     'operation': 'resize_image'
                 }
-            with Image.open(image_path) as img:
-                resized = img.resize((width, height))
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                resized.save(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            vips_saved = PYVIPS_AVAILABLE and self._resize_vips(
+                image_path, width, height, output_path, _vips_save_options(output_path, quality, fast_encode))
+            if not vips_saved:
+                self._resize_pillow(image_path, width, height, output_path,
+                                    _save_options(output_path, quality, fast_encode))
             return {
                 'success': True,
                 'operation': 'resize_image',
                 'input_path': str(image_path),
                 'output_path': str(output_path),
                 'new_dimensions': f"{width}x{height}",
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
             }
         except Exception as e:
             logger.error(f"Error resizing image {image_path}: {str(e)}")
@@ -45,4 +129,29 @@ class ImageResizer:
                 'operation': 'resize_image',
                 'input_path': str(image_path),
                 'output_path': str(output_path)
-            } 
\ No newline at end of file
+            }
+    
+    def resize_many(self, items: Iterable[Dict[str, Any]],
+                    max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Resize many images across worker processes.
+        
+        Args:
+            items: Dicts of resize arguments (image_path, width, height, output_path,
+                optionally quality and fast_encode)
+            max_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            One resize result per item, in input order
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [self.resize(**item) for item in items]
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(items))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_resize_one, items, chunksize=4))
+
+def _resize_one(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Process pool entry point; module level so it can be pickled"""
+    return ImageResizer().resize(**item)
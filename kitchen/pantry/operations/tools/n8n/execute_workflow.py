@@ -4,10 +4,13 @@ n8n Workflow Execution Operation
 Single-purpose module for n8n workflow execution operations.
 """
 
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional
+import time
+import asyncio
+import httpx
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,62 +26,121 @@ class N8NWorkflowExecutor:
             'Content-Type': 'application/json',
             'X-N8N-API-KEY': api_key
         } if api_key else {'Content-Type': 'application/json'}
+        
+        # Reuse keep-alive connections across calls instead of reconnecting per request
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+    
+    def _trigger_body(self, workflow_id: str, data: Optional[Dict[str, Any]]) -> bytes:
+        """Serialize the trigger payload for a workflow"""
+        payload = {
+            "workflowId": workflow_id
+        }
+        
+        if data:
+            payload["data"] = data
+        
+        return orjson.dumps(payload)
+    
+    def _execution_result(self, workflow_id: str, data: Optional[Dict[str, Any]], content: bytes) -> Dict[str, Any]:
+        """Shape a trigger response into the operation result"""
+        result = orjson.loads(content)
+        
+        return {
+            'success': True,
+            'operation': 'execute_workflow',
+            'workflow_id': workflow_id,
+            'execution_id': result.get('executionId'),
+            'status': result.get('status', 'running'),
+            'data': data,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+        }
+    
+    def _execution_failure(self, error: Exception, request_failed: bool) -> Dict[str, Any]:
+        """Log and shape an execute_workflow error result"""
+        if request_failed:
+            logger.error(f"Error calling n8n API: {str(error)}")
+            message = f"API request failed: {str(error)}"
+        else:
+            logger.error(f"Error executing workflow: {str(error)}")
+            message = str(error)
+        return {
+            'success': False,
+            'error': message,
+            'operation': 'execute_workflow'
+        }
     
     def execute_workflow(self, workflow_id: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Execute an n8n workflow"""
         try:
-            payload = {
-                "workflowId": workflow_id
-            }
-            
-            if data:
-                payload["data"] = data
-            
-            response = requests.post(f"{self.api_url}/workflows/{workflow_id}/trigger", 
-                                   json=payload, headers=self.headers)
+            response = self._session.post(f"{self.api_url}/workflows/{workflow_id}/trigger",
+                                          data=self._trigger_body(workflow_id, data))
             response.raise_for_status()
             
-            result = response.json()
-            
-            return {
-                'success': True,
-                'operation': 'execute_workflow',
-                'workflow_id': workflow_id,
-                'execution_id': result.get('executionId'),
-                'status': result.get('status', 'running'),
-                'data': data,
-                'timestamp': datetime.now().isoformat()
-            }
+            return self._execution_result(workflow_id, data, response.content)
                 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error calling n8n API: {str(e)}")
-            return {
-                'success': False,
-                'error': f"API request failed: {str(e)}",
-                'operation': 'execute_workflow'
-            }
+            return self._execution_failure(e, request_failed=True)
         except Exception as e:
-            logger.error(f"Error executing workflow: {str(e)}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operation': 'execute_workflow'
-            }
+            return self._execution_failure(e, request_failed=False)
+    
+    async def _execute_workflow_async(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                                      item: Dict[str, Any]) -> Dict[str, Any]:
+        """Trigger one batch item's workflow on a shared async client"""
+        try:
+            workflow_id = item['workflow_id']
+            data = item.get('data')
+            async with semaphore:
+                response = await client.post(f"{self.api_url}/workflows/{workflow_id}/trigger",
+                                             content=self._trigger_body(workflow_id, data))
+            response.raise_for_status()
+            
+            return self._execution_result(workflow_id, data, response.content)
+        
+        except KeyError as e:
+            return self._execution_failure(ValueError(f"Item is missing {e}"), request_failed=False)
+        except httpx.HTTPError as e:
+            return self._execution_failure(e, request_failed=True)
+        except Exception as e:
+            return self._execution_failure(e, request_failed=False)
+    
+    async def execute_workflows(self, items: Iterable[Dict[str, Any]],
+                                max_concurrency: int = 64, timeout: float = 30.0) -> List[Dict[str, Any]]:
+        """
+        Trigger many workflows concurrently.
+        
+        Args:
+            items: Dicts with a 'workflow_id' and optional 'data', as for execute_workflow
+            max_concurrency: Maximum number of triggers in flight at once
+            timeout: Per-request network timeout in seconds
+            
+        Returns:
+            One execute_workflow result per item, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+        async with httpx.AsyncClient(headers=self.headers, limits=limits, timeout=timeout) as client:
+            return await asyncio.gather(*(
+                self._execute_workflow_async(client, semaphore, item) for item in items
+            ))
     
     def get_workflows(self) -> Dict[str, Any]:
         """Get list of available workflows"""
         try:
-            response = requests.get(f"{self.api_url}/workflows", headers=self.headers)
+            response = self._session.get(f"{self.api_url}/workflows")
             response.raise_for_status()
             
-            workflows = response.json()
+            workflows = orjson.loads(response.content)
             
             return {
                 'success': True,
                 'operation': 'get_workflows',
                 'workflows': workflows.get('data', []),
                 'total': len(workflows.get('data', [])),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
             }
                 
         except requests.exceptions.RequestException as e:
@@ -4,10 +4,13 @@ Penpot Project Creation Operation
 Single-purpose module for Penpot project creation operations.
 """
 
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional
+import time
+import asyncio
+import httpx
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,65 +26,126 @@ class PenpotProjectCreator:
             'Content-Type': 'application/json',
             'Authorization': f'Token {api_token}'
         } if api_token else {'Content-Type': 'application/json'}
+        
+        # Reuse keep-alive connections across calls instead of reconnecting per request
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+    
+    def _project_body(self, name: str, description: str, team_id: Optional[str]) -> bytes:
+        """Serialize the project creation payload"""
+        payload = {
+            "name": name,
+            "description": description
+        }
+        
+        if team_id:
+            payload["team-id"] = team_id
+        
+        return orjson.dumps(payload)
+    
+    def _project_result(self, name: str, description: str, team_id: Optional[str],
+                        content: bytes) -> Dict[str, Any]:
+        """Shape a project creation response into the operation result"""
+        result = orjson.loads(content)
+        
+        return {
+            'success': True,
+            'operation': 'create_project',
+            'project_id': result.get('id'),
+            'project_name': name,
+            'description': description,
+            'team_id': team_id,
+            'created_at': result.get('created-at'),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+        }
+    
+    def _project_failure(self, error: Exception, request_failed: bool) -> Dict[str, Any]:
+        """Log and shape a create_project error result"""
+        if request_failed:
+            logger.error(f"Error calling Penpot API: {str(error)}")
+            message = f"API request failed: {str(error)}"
+        else:
+            logger.error(f"Error creating project: {str(error)}")
+            message = str(error)
+        return {
+            'success': False,
+            'error': message,
+            'operation': 'create_project'
+        }
     
     def create_project(self, name: str, description: str = "", 
                       team_id: Optional[str] = None) -> Dict[str, Any]:
         """Create a new Penpot project"""
         try:
-            payload = {
-                "name": name,
-                "description": description
-            }
-            
-            if team_id:
-                payload["team-id"] = team_id
-            
-            response = requests.post(f"{self.api_url}/projects", 
-                                   json=payload, headers=self.headers)
+            response = self._session.post(f"{self.api_url}/projects",
+                                          data=self._project_body(name, description, team_id))
             response.raise_for_status()
             
-            result = response.json()
-            
-            return {
-                'success': True,
-                'operation': 'create_project',
-                'project_id': result.get('id'),
-                'project_name': name,
-                'description': description,
-                'team_id': team_id,
-                'created_at': result.get('created-at'),
-                'timestamp': datetime.now().isoformat()
-            }
+            return self._project_result(name, description, team_id, response.content)
                 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error calling Penpot API: {str(e)}")
-            return {
-                'success': False,
-                'error': f"API request failed: {str(e)}",
-                'operation': 'create_project'
-            }
+            return self._project_failure(e, request_failed=True)
         except Exception as e:
-            logger.error(f"Error creating project: {str(e)}")
-            return {
-                'success': False,
-                'error': str(e),
-                'operation': 'create_project'
-            }
+            return self._project_failure(e, request_failed=False)
+    
+    async def _create_project_async(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                                    item: Dict[str, Any]) -> Dict[str, Any]:
+        """Create one batch item's project on a shared async client"""
+        try:
+            name = item['name']
+            description = item.get('description', "")
+            team_id = item.get('team_id')
+            async with semaphore:
+                response = await client.post(f"{self.api_url}/projects",
+                                             content=self._project_body(name, description, team_id))
+            response.raise_for_status()
+            
+            return self._project_result(name, description, team_id, response.content)
+        
+        except KeyError as e:
+            return self._project_failure(ValueError(f"Item is missing {e}"), request_failed=False)
+        except httpx.HTTPError as e:
+            return self._project_failure(e, request_failed=True)
+        except Exception as e:
+            return self._project_failure(e, request_failed=False)
+    
+    async def create_projects(self, items: Iterable[Dict[str, Any]],
+                              max_concurrency: int = 64, timeout: float = 30.0) -> List[Dict[str, Any]]:
+        """
+        Create many projects concurrently.
+        
+        Args:
+            items: Dicts with a 'name' and optional 'description' and 'team_id', as for create_project
+            max_concurrency: Maximum number of requests in flight at once
+            timeout: Per-request network timeout in seconds
+            
+        Returns:
+            One create_project result per item, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+        async with httpx.AsyncClient(headers=self.headers, limits=limits, timeout=timeout) as client:
+            return await asyncio.gather(*(
+                self._create_project_async(client, semaphore, item) for item in items
+            ))
     
     def get_projects(self) -> Dict[str, Any]:
         """Get list of available projects"""
         try:
-            response = requests.get(f"{self.api_url}/projects", headers=self.headers)
+            response = self._session.get(f"{self.api_url}/projects")
             response.raise_for_status()
             
-            projects = response.json()
+            projects = orjson.loads(response.content)
             
             return {
                 'success': True,
                 'operation': 'get_projects',
                 'projects': projects,
                 'total': len(projects),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
             }
                 
         except requests.exceptions.RequestException as e:
@@ -4,10 +4,17 @@ Test Ingredients Script
 Verifies all ingredient files work with the pantry system
 """
 
-import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# orjson parses several times faster; the stdlib parser is the fallback
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Add the pantry directory to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -18,6 +25,29 @@ from core.discovery_engine import DiscoveryEngine
 from core.validation_system import ValidationSystem
 from datetime import datetime
 
+REQUIRED_FIELDS = ("id", "type", "name", "version")
+
+def _list_json_files(dir_path):
+    """List *.json files with os.scandir, or None if the directory does not exist"""
+    try:
+        with os.scandir(dir_path) as entries:
+            # DirEntry carries the file type from the directory read, and has .name like Path
+            return [entry for entry in entries
+                    if entry.name.endswith('.json') and not entry.name.startswith('.') and entry.is_file()]
+    except FileNotFoundError:
+        return None
+
+def _validate_ingredient_file(file_path):
+    """Parse one ingredient file off the main thread, returning (missing_fields, error)"""
+    try:
+        with open(file_path, 'rb') as f:
+            ingredient = json_loads(f.read())
+        
+        # Validate basic structure
+        return [field for field in REQUIRED_FIELDS if field not in ingredient], None
+    except Exception as e:
+        return None, e
+
 def test_ingredient_files():
     """Test that all ingredient files are properly structured"""
     print("📁 Testing Ingredient Files...")
@@ -26,33 +56,35 @@ def test_ingredient_files():
     total_files = 0
     valid_files = 0
     
+    # List every directory first so all files can be parsed on one thread pool
+    listings = []
     for dir_name in ingredient_dirs:
         dir_path = Path(f"ingredients/{dir_name}")
-        if not dir_path.exists():
+        files = _list_json_files(dir_path)
+        listings.append((dir_name, dir_path, files))
+    
+    all_files = [file_path for _, _, files in listings if files for file_path in files]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = iter(list(executor.map(_validate_ingredient_file, all_files)))
+    
+    # Report on the main thread, in listing order
+    for dir_name, dir_path, files in listings:
+        if files is None:
             print(f"   ✗ Directory {dir_path} does not exist")
             continue
             
-        files = list(dir_path.glob("*.json"))
         print(f"   ✓ {dir_name}: {len(files)} files found")
         total_files += len(files)
         
         for file_path in files:
-            try:
-                with open(file_path, 'r') as f:
-                    ingredient = json.load(f)
-                
-                # Validate basic structure
-                required_fields = ["id", "type", "name", "version"]
-                missing_fields = [field for field in required_fields if field not in ingredient]
-                
-                if missing_fields:
-                    print(f"      ✗ {file_path.name}: Missing fields {missing_fields}")
-                else:
-                    print(f"      ✓ {file_path.name}: Valid structure")
-                    valid_files += 1
-                    
-            except Exception as e:
-                print(f"      ✗ {file_path.name}: Error reading file - {e}")
+            missing_fields, error = next(results)
+            if error is not None:
+                print(f"      ✗ {file_path.name}: Error reading file - {error}")
+            elif missing_fields:
+                print(f"      ✗ {file_path.name}: Missing fields {missing_fields}")
+            else:
+                print(f"      ✓ {file_path.name}: Valid structure")
+                valid_files += 1
     
     print(f"\n📊 Summary: {valid_files}/{total_files} files valid")
     return valid_files == total_files
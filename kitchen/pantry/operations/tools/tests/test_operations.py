@@ -5,10 +5,14 @@ Test Pantry Operations
 Demonstrates how ingredients (metadata) and operations (functionality) work together.
 """
 
-import json
 import sys
 from pathlib import Path
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Add the operations package to the path
 sys.path.append(str(Path(__file__).parent))
 
@@ -23,8 +27,8 @@ from operations.tools import (
 def load_ingredient(ingredient_path: str) -> dict:
     """Load an ingredient from JSON file"""
     try:
-        with open(ingredient_path, 'r') as f:
-            return json.load(f)
+        with open(ingredient_path, 'rb') as f:
+            return json_loads(f.read())
     except Exception as e:
         print(f"Error loading ingredient {ingredient_path}: {e}")
         return {}
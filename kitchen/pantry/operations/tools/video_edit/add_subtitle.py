@@ -4,14 +4,23 @@ Video Add Subtitle Operation
 Single-purpose module for adding subtitles to videos.
 """
 
-from moviepy import VideoFileClip, TextClip, CompositeVideoClip
 from pathlib import Path
 from typing import Dict, Any
 from datetime import datetime
+import subprocess
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Height of the subtitle band along the bottom of the frame
+_BAND_HEIGHT = 50
+
+def _escape_drawtext(text: str) -> str:
+    """Escape text for a drawtext option value inside an ffmpeg filtergraph"""
+    # First for the filter option parser, then for the filtergraph parser around it
+    value = text.replace('\\', '\\\\').replace("'", "\\'").replace(':', '\\:')
+    return ''.join('\\' + char if char in "\\'[],;" else char for char in value)
+
 class VideoSubtitleAdder:
     """Add subtitle to video operation"""
     
@@ -25,11 +34,23 @@ class VideoSubtitleAdder:
                     'error': f'Video not found: {video_path}',
                     'operation': 'add_subtitle'
                 }
-            with VideoFileClip(str(video_path)) as clip:
-                txt_clip = TextClip(subtitle_text, fontsize=fontsize, color='white', bg_color='black', size=(clip.w, 50)).set_position(('center', 'bottom')).set_duration(clip.duration)
-                video = CompositeVideoClip([clip, txt_clip])
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                video.write_videofile(str(output_path), codec="libx264", audio_codec="aac", verbose=False, logger=None)
+            # Burn the subtitle in with ffmpeg filters: a black band across the bottom
+            # with the text centred on it, as the old moviepy composite drew it
+            video_filter = (
+                f"drawbox=x=0:y=ih-{_BAND_HEIGHT}:w=iw:h={_BAND_HEIGHT}:color=black:t=fill,"
+                f"drawtext=text={_escape_drawtext(subtitle_text)}:expansion=none:"
+                f"fontcolor=white:fontsize={fontsize}:"
+                f"x=(w-text_w)/2:y=h-{_BAND_HEIGHT // 2}-text_h/2"
+            )
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            result = subprocess.run(
+                ["ffmpeg", "-nostdin", "-y", "-loglevel", "error", "-i", str(video_path),
+                 "-vf", video_filter, "-c:v", "libx264", "-preset", "veryfast", "-c:a", "copy",
+                 str(output_path)],
+                capture_output=True, text=True
+            )
+            if result.returncode != 0:
+                raise RuntimeError(f"ffmpeg exited with status {result.returncode}: {result.stderr.strip()}")
             return {
                 'success': True,
                 'operation': 'add_subtitle',
@@ -4,10 +4,10 @@ Video Trim Operation
 Single-purpose module for trimming videos.
 """
 
-from moviepy import VideoFileClip
 from pathlib import Path
 from typing import Dict, Any
 from datetime import datetime
+import subprocess
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,7 +15,34 @@ logger = logging.getLogger(__name__)
 class VideoTrimmer:
     """Trim video operation"""
     
-    def trim(self, video_path: str, start_time: float, end_time: float, output_path: str) -> Dict[str, Any]:
+    def _trim_stream_copy(self, video_path: Path, start_time: float, end_time: float, output_path: Path) -> None:
+        """Cut with ffmpeg, seeking on the input and copying packets without decoding"""
+        result = subprocess.run(
+            ["ffmpeg", "-nostdin", "-y", "-loglevel", "error",
+             "-ss", str(start_time), "-i", str(video_path), "-t", str(end_time - start_time),
+             "-c", "copy", "-avoid_negative_ts", "make_zero", str(output_path)],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with status {result.returncode}: {result.stderr.strip()}")
+    
+    def _trim_reencode(self, video_path: Path, start_time: float, end_time: float, output_path: Path) -> None:
+        """Cut by decoding and re-encoding every frame with moviepy"""
+        from moviepy import VideoFileClip
+        
+        with VideoFileClip(str(video_path)) as clip:
+            trimmed = clip.subclip(start_time, end_time)
+            trimmed.write_videofile(str(output_path), codec="libx264", audio_codec="aac", verbose=False, logger=None)
+    
+    def trim(self, video_path: str, start_time: float, end_time: float, output_path: str,
+             reencode: bool = False) -> Dict[str, Any]:
+        """
+        Trim a video to the given time range.
+        
+        By default the streams are copied, which is fast and lossless but starts the
+        cut at the keyframe at or before start_time. Pass reencode=True for a
+        frame-accurate cut.
+        """
         try:
             video_path = Path(video_path)
             output_path = Path(output_path)
@@ -25,10 +52,11 @@ class VideoTrimmer:
                     'error': f'Video not found: {video_path}',
                     'operation': 'trim_video'
                 }
-            with VideoFileClip(str(video_path)) as clip:
-                trimmed = clip.subclip(start_time, end_time)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                trimmed.write_videofile(str(output_path), codec="libx264", audio_codec="aac", verbose=False, logger=None)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if reencode:
+                self._trim_reencode(video_path, start_time, end_time, output_path)
+            else:
+                self._trim_stream_copy(video_path, start_time, end_time, output_path)
             return {
                 'success': True,
                 'operation': 'trim_video',